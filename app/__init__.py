@@ -15,11 +15,14 @@ from .routes.api.console_routes import console_api_bp
 from .routes.auth_routes import auth_bp
 from .routes.server_routes import server_bp
 from .security import add_security_headers, audit_log
+from .utils import is_admin_password_set, is_admin_setup_exempt
 
 
 def create_app():
     app = Flask(__name__)
-    app.config.from_object(get_config())
+    config_class = get_config()
+    app.config.from_object(config_class)
+    app.config["SECRET_KEY"] = config_class.get_secret_key()
 
     # Initialize structured logging
     setup_logging(app)
@@ -72,14 +75,11 @@ def create_app():
     def check_admin_setup():
         """Check if admin setup is needed and redirect accordingly."""
         # Skip check for admin setup and static endpoints
-        if request.endpoint in ["auth.set_admin_password", "static"] or (
-            request.endpoint and request.endpoint.startswith("static")
-        ):
+        if is_admin_setup_exempt(request.endpoint):
             return
 
-        # Check if any admin user exists with a password
-        admin_user = User.query.filter_by(is_admin=True).first()
-        if not admin_user or not admin_user.password_hash:
+        # Check if any admin user exists with a password; latched once true
+        if not is_admin_password_set():
             # No admin user or admin has no password - redirect to setup
             return redirect(url_for("auth.set_admin_password"))
 
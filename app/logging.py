@@ -125,8 +125,16 @@ class StructuredLogger:
         security_handler.setFormatter(JSONFormatter())
         self.logger.addHandler(security_handler)
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message of the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
+
     def _log_with_context(self, level: int, message: str, extra_fields: Dict[str, Any] = None):
         """Log with additional context information."""
+        # Skip context collection entirely for records that would be dropped
+        if not self.logger.isEnabledFor(level):
+            return
+
         extra_fields = extra_fields or {}
 
         # Add request context if available
@@ -12,7 +12,7 @@ from flask import (
     url_for,
 )
 from flask_login import current_user, login_required, login_user, logout_user
-from werkzeug.security import check_password_hash, generate_password_hash
+from werkzeug.security import check_password_hash
 
 from ..extensions import csrf, db, login_manager
 from ..models import User
@@ -20,6 +20,7 @@ from ..security import (
     PasswordPolicyError,
     SecurityUtils,
     audit_log,
+    hash_password,
     rate_limit,
     rate_limiter,
     validate_password_policy,
@@ -28,6 +29,8 @@ from ..utils import (
     get_app_config,
     get_experimental_features,
     get_system_memory_for_admin,
+    mark_admin_password_set,
+    reset_admin_password_cache,
     toggle_experimental_feature,
     update_app_config,
 )
@@ -164,10 +167,12 @@ def set_admin_password():
         if admin_user and not admin_user.password_hash:
             # Update existing admin user
             admin_user.username = username
-            admin_user.password_hash = generate_password_hash(password)
+            admin_user.password_hash = hash_password(password)
             admin_user.email = email if email else None
             db.session.commit()
 
+            mark_admin_password_set()
+
             audit_log("admin_account_updated", {"username": username, "email": email})
             flash("Admin account updated successfully. Please log in.", "success")
         else:
@@ -179,7 +184,7 @@ def set_admin_password():
 
             new_admin_user = User(
                 username=username,
-                password_hash=generate_password_hash(password),
+                password_hash=hash_password(password),
                 email=email if email else None,
                 is_admin=True,
                 is_active=True,
@@ -187,6 +192,8 @@ def set_admin_password():
             db.session.add(new_admin_user)
             db.session.commit()
 
+            mark_admin_password_set()
+
             audit_log("admin_account_created", {"username": username, "email": email})
             flash("Admin account created successfully. Please log in.", "success")
 
@@ -233,7 +240,7 @@ def add_user():
         # Create new user
         new_user = User(
             username=username,
-            password_hash=generate_password_hash(password),
+            password_hash=hash_password(password),
             email=email if email else None,
             is_admin=is_admin,
             is_active=True,
@@ -260,7 +267,7 @@ def change_password():
         if new_password != confirm_password:
             flash("New passwords do not match.", "danger")
             return render_template("change_password.html")
-        current_user.password_hash = generate_password_hash(new_password)
+        current_user.password_hash = hash_password(new_password)
         db.session.commit()
         flash("Password changed successfully.", "success")
         return redirect(url_for("server.home"))
@@ -308,12 +315,16 @@ def edit_user(user_id):
                 return render_template("edit_user.html", user=user)
 
         # Update user
+        was_admin = user.is_admin
         user.username = username
         user.email = email if email else None
         user.is_admin = is_admin
         user.is_active = is_active
 
         db.session.commit()
+        if was_admin and not is_admin:
+            # This may have removed the last admin, so re-check on the next request
+            reset_admin_password_cache()
         flash(f"User {username} updated successfully.", "success")
         return redirect(url_for("auth.manage_users"))
 
@@ -341,8 +352,11 @@ def delete_user(user_id):
         return redirect(url_for("auth.manage_users"))
 
     username = user.username
+    was_admin = user.is_admin
     db.session.delete(user)
     db.session.commit()
+    if was_admin:
+        reset_admin_password_cache()
 
     flash(f"User {username} deleted successfully.", "success")
     return redirect(url_for("auth.manage_users"))
@@ -366,7 +380,7 @@ def reset_user_password(user_id):
         flash("Passwords do not match.", "danger")
         return redirect(url_for("auth.edit_user", user_id=user_id))
 
-    user.password_hash = generate_password_hash(new_password)
+    user.password_hash = hash_password(new_password)
     db.session.commit()
 
     flash(f"Password for {user.username} reset successfully.", "success")
@@ -10,6 +10,7 @@ from functools import wraps
 import jwt
 from flask import abort, current_app, request
 from flask_login import current_user
+from werkzeug.security import generate_password_hash
 
 
 class SecurityError(Exception):
@@ -230,6 +231,19 @@ class RateLimiter:
 rate_limiter = RateLimiter()
 
 
+def hash_password(password):
+    """
+    Hash a password with the configured PASSWORD_HASH_METHOD.
+
+    Args:
+        password (str): Plain-text password
+
+    Returns:
+        str: Werkzeug password hash, which records its own method
+    """
+    return generate_password_hash(password, method=current_app.config["PASSWORD_HASH_METHOD"])
+
+
 def rate_limit(max_attempts=5, window_seconds=60, key_func=None):
     """
     Decorator to implement rate limiting.
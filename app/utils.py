@@ -1,15 +1,24 @@
+import errno
 import hashlib
 import json
+import logging
 import os
 import re
 import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import psutil
 import requests
-from flask import redirect, request, url_for
+from flask import current_app, g, redirect, request, url_for
 from flask_login import current_user
+from requests.adapters import HTTPAdapter
+from sqlalchemy.orm import load_only
+from urllib3.util.retry import Retry
 
 from .error_handlers import (
     FileOperationError,
@@ -23,60 +32,94 @@ from .error_handlers import (
 from .extensions import db
 from .models import Server, User
 
-# Test comment for CARD-025 validation
+try:
+    import orjson
 
+    def _loads(data):
+        """Parse JSON bytes or text using orjson."""
+        return orjson.loads(data)
 
-def is_valid_server_name(name):
-    """
-    Validate server name to contain only letters, numbers, underscores, and hyphens.
-    Enhanced security validation to prevent directory traversal and injection attacks.
-    """
-    if not name or not isinstance(name, str):
-        return False
+except ImportError:  # pragma: no cover - orjson is an optional speedup
 
-    # Check length constraints
-    if len(name) < 1 or len(name) > 150:
-        return False
+    def _loads(data):
+        """Parse JSON bytes or text using the standard library."""
+        return json.loads(data)
 
-    # Check for valid characters only (alphanumeric, underscore, hyphen)
-    if not re.match(r"^[a-zA-Z0-9_-]+$", name):
-        return False
 
-    # Prevent directory traversal patterns
-    forbidden_patterns = ["..", "./", "\\", "/", "~", "$", "`"]
-    for pattern in forbidden_patterns:
-        if pattern in name:
-            return False
+# Test comment for CARD-025 validation
+
+# Shared HTTP session so Mojang API calls reuse pooled keep-alive connections
+_HTTP = requests.Session()
+_HTTP.headers.update({"User-Agent": "mcServerManager", "Accept-Encoding": "gzip"})
+_HTTP.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        ),
+    ),
+)
 
-    # Prevent reserved names
-    reserved_names = [
+# Parsed version manifest, reused until the TTL expires
+_MANIFEST_TTL_SECONDS = 600
+_MANIFEST_CACHE = {
+    "data": None,
+    "expires_at": 0.0,
+    "etag": None,
+    "last_modified": None,
+    "version_index": None,
+}
+_MANIFEST_LOCK = threading.Lock()
+
+# Windows device names that cannot be used as server directory names
+_RESERVED_NAMES = frozenset(
+    {
         "con",
         "prn",
         "aux",
         "nul",
-        "com1",
-        "com2",
-        "com3",
-        "com4",
-        "com5",
-        "com6",
-        "com7",
-        "com8",
-        "com9",
-        "lpt1",
-        "lpt2",
-        "lpt3",
-        "lpt4",
-        "lpt5",
-        "lpt6",
-        "lpt7",
-        "lpt8",
-        "lpt9",
-    ]
-    if name.lower() in reserved_names:
-        return False
+        *(f"com{i}" for i in range(1, 10)),
+        *(f"lpt{i}" for i in range(1, 10)),
+    }
+)
+# \Z rather than $ so a trailing newline cannot slip through
+_SERVER_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]{1,150}\Z", re.ASCII)
 
-    return True
+# app.extensions key latching that an admin password exists
+_ADMIN_PASSWORD_SET_KEY = "admin_password_set"
+
+# Endpoints that must stay reachable while the admin password is unset
+_ADMIN_SETUP_ALLOWED_ENDPOINTS = frozenset({"auth.set_admin_password", "static"})
+
+# Parsed exclusion lists keyed by path, stored as (st_mtime_ns, versions)
+_EXCLUSION_CACHE = {}
+
+
+def is_valid_server_name(name):
+    """
+    Validate server name to contain only letters, numbers, underscores, and hyphens.
+    Enhanced security validation to prevent directory traversal and injection attacks.
+    """
+    return (
+        bool(name)
+        and isinstance(name, str)
+        # Valid characters only (alphanumeric, underscore, hyphen), 1-150 long.
+        # The charset excludes ".", "/", "\\", "~", "$" and "`", so this also
+        # rules out directory traversal and shell metacharacters.
+        and _SERVER_NAME_RE.match(name) is not None
+        # Prevent reserved names
+        and name.lower() not in _RESERVED_NAMES
+    )
+
+
+# Bind errors that mean the port cannot be used, whether or not anything listens
+_UNUSABLE_PORT_ERRNOS = frozenset({errno.EADDRINUSE, errno.EACCES, errno.EPERM})
 
 
 def is_port_available(port):
@@ -93,10 +136,29 @@ def is_port_available(port):
         if port < 1024:
             logger.warning(f"Attempting to use reserved port {port}")
 
+        # Try the same bind a server would perform; unlike a connect probe this
+        # never waits on a timeout and also catches ports bound but not accepting
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)  # Add timeout to prevent hanging
-            result = s.connect_ex(("localhost", port))
-            return result != 0
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                s.bind(("", port))
+                s.listen(1)
+                return True
+            except OSError as e:
+                # The port is taken, or the OS refuses it to this process
+                if e.errno in _UNUSABLE_PORT_ERRNOS:
+                    return False
+                bind_error = e
+
+        # Any other bind failure says nothing about whether the port is taken,
+        # so fall back to a short reachability probe
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Bind check inconclusive for port {port}: {str(bind_error)}")
+        try:
+            with socket.create_connection(("localhost", port), timeout=0.2):
+                return False
+        except OSError:
+            return True
     except socket.error as e:
         logger.error(f"Socket error checking port {port}: {str(e)}")
         raise ServerError(f"Unable to check port availability: {str(e)}")
@@ -105,6 +167,18 @@ def is_port_available(port):
         raise ServerError(f"Port check failed: {str(e)}")
 
 
+def _probe_port(port):
+    """Check a single candidate port, treating probe errors as unavailable."""
+    try:
+        available = is_port_available(port)
+    except (ValidationError, ServerError) as e:
+        logger.warning(f"Error checking port {port}: {str(e)}")
+        return False
+    if not available and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Port {port} is currently in use")
+    return available
+
+
 def find_next_available_port():
     """
     Find the next available port, starting from 25565 and incrementing by 10.
@@ -116,27 +190,31 @@ def find_next_available_port():
 
     try:
         # Get a list of all ports already assigned to servers
-        assigned_ports = {server.port for server in Server.query.all()}
-        logger.info(f"Found {len(assigned_ports)} ports already assigned: {assigned_ports}")
+        assigned_ports = {port for (port,) in db.session.query(Server.port).all()}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(assigned_ports)} ports already assigned: {assigned_ports}")
 
+        candidates = []
         for i in range(max_checks):
             port_to_check = base_port + (i * increment)
 
             # Check if the port is already assigned in the database
             if port_to_check in assigned_ports:
-                logger.debug(f"Port {port_to_check} already assigned in database")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Port {port_to_check} already assigned in database")
                 continue
+            candidates.append(port_to_check)
 
-            # Check if the port is currently in use
-            try:
-                if is_port_available(port_to_check):
+        # Probe the remaining candidates concurrently; map() keeps input order
+        # so the lowest free port still wins
+        if candidates:
+            with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+                results = list(executor.map(_probe_port, candidates))
+
+            for port_to_check, available in zip(candidates, results):
+                if available:
                     logger.info(f"Found available port: {port_to_check}")
                     return port_to_check
-                else:
-                    logger.debug(f"Port {port_to_check} is currently in use")
-            except (ValidationError, ServerError) as e:
-                logger.warning(f"Error checking port {port_to_check}: {str(e)}")
-                continue
 
         # If we get here, no ports were available
         error_msg = (
@@ -153,36 +231,161 @@ def find_next_available_port():
         raise ServerError(f"Port allocation failed: {str(e)}")
 
 
+def _manifest_disk_cache_path():
+    """Return the on-disk manifest cache path, or None if disabled or outside an app."""
+    try:
+        filename = current_app.config.get("VERSION_MANIFEST_CACHE_FILE")
+        instance_path = current_app.instance_path
+    except RuntimeError:
+        # Working outside of application context
+        return None
+    if not filename:
+        return None
+    return os.path.join(instance_path, filename)
+
+
+def _load_manifest_from_disk(path):
+    """Load (manifest, etag, last_modified) saved by _save_manifest_to_disk, if any."""
+    try:
+        with open(path, "rb") as f:
+            stored = _loads(f.read())
+        return stored["body"], stored.get("etag"), stored.get("last_modified")
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable version manifest cache {path}: {str(e)}")
+        return None
+
+
+def _save_manifest_to_disk(path, manifest, etag, last_modified):
+    """Persist the manifest with its validators; failures only cost a future download."""
+    if not etag and not last_modified:
+        # Without validators the copy could never be revalidated
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"etag": etag, "last_modified": last_modified, "body": manifest}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write version manifest cache {path}: {str(e)}")
+
+
 @handle_network_error
 def fetch_version_manifest():
     """
     Fetches the main version manifest from Mojang's API.
     Enhanced with proper error handling and logging.
+
+    The parsed manifest is cached for _MANIFEST_TTL_SECONDS. Once expired it
+    is revalidated with If-None-Match/If-Modified-Since, and a 304 response
+    keeps the cached copy. When VERSION_MANIFEST_CACHE_FILE is configured the
+    manifest is also kept under the instance folder to survive restarts.
     """
     manifest_url = "https://piston-meta.mojang.com/mc/game/version_manifest.json"
 
-    logger.info(f"Fetching version manifest from: {manifest_url}")
+    with _MANIFEST_LOCK:
+        cached = _MANIFEST_CACHE["data"]
+        if cached is not None and time.monotonic() < _MANIFEST_CACHE["expires_at"]:
+            return cached
+
+        # After a restart, seed the cache from disk so the first fetch can be
+        # a conditional request instead of a full download
+        disk_path = _manifest_disk_cache_path()
+        if cached is None and disk_path:
+            stored = _load_manifest_from_disk(disk_path)
+            if stored is not None:
+                cached, etag, last_modified = stored
+                _MANIFEST_CACHE.update(
+                    data=cached,
+                    expires_at=0.0,
+                    etag=etag,
+                    last_modified=last_modified,
+                    version_index=None,
+                )
 
-    try:
-        response = requests.get(manifest_url, timeout=15)
-        response.raise_for_status()
+        logger.info(f"Fetching version manifest from: {manifest_url}")
 
-        manifest_data = response.json()
-        logger.info(
-            f"Successfully fetched manifest with "
-            f"{len(manifest_data.get('versions', []))} versions"
+        headers = {}
+        if cached is not None:
+            if _MANIFEST_CACHE["etag"]:
+                headers["If-None-Match"] = _MANIFEST_CACHE["etag"]
+            if _MANIFEST_CACHE["last_modified"]:
+                headers["If-Modified-Since"] = _MANIFEST_CACHE["last_modified"]
+
+        try:
+            response = _HTTP.get(manifest_url, timeout=15, headers=headers)
+
+            if cached is not None and response.status_code == 304:
+                logger.info("Version manifest not modified, reusing cached copy")
+                _MANIFEST_CACHE["expires_at"] = time.monotonic() + _MANIFEST_TTL_SECONDS
+                return cached
+
+            response.raise_for_status()
+
+            manifest_data = _loads(response.content)
+            logger.info(
+                f"Successfully fetched manifest with "
+                f"{len(manifest_data.get('versions', []))} versions"
+            )
+
+            _MANIFEST_CACHE.update(
+                data=manifest_data,
+                expires_at=time.monotonic() + _MANIFEST_TTL_SECONDS,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                version_index=None,
+            )
+            if disk_path:
+                _save_manifest_to_disk(
+                    disk_path,
+                    manifest_data,
+                    _MANIFEST_CACHE["etag"],
+                    _MANIFEST_CACHE["last_modified"],
+                )
+            return manifest_data
+        except ValueError as e:
+            error_msg = "Invalid JSON response from version manifest API"
+            logger.error(f"{error_msg}: {str(e)}")
+            raise NetworkError(error_msg)
+        except Exception as e:
+            # The @handle_network_error decorator will catch and convert network errors
+            # Any other errors should be logged and re-raised
+            logger.error(f"Unexpected error fetching manifest: {str(e)}")
+            raise
+
+
+def clear_version_manifest_cache():
+    """Drop the cached version manifest so the next fetch hits Mojang's API."""
+    with _MANIFEST_LOCK:
+        _MANIFEST_CACHE.update(
+            data=None, expires_at=0.0, etag=None, last_modified=None, version_index=None
         )
 
-        return manifest_data
-    except requests.exceptions.JSONDecodeError as e:
-        error_msg = "Invalid JSON response from version manifest API"
-        logger.error(f"{error_msg}: {str(e)}")
-        raise NetworkError(error_msg)
-    except Exception as e:
-        # The @handle_network_error decorator will catch and convert network errors
-        # Any other errors should be logged and re-raised
-        logger.error(f"Unexpected error fetching manifest: {str(e)}")
-        raise
+
+def _get_version_index(manifest):
+    """
+    Return a version id -> manifest entry mapping for the given manifest.
+
+    The index for the cached manifest is built once and reused, turning each
+    version lookup into a dict access instead of a scan over every release.
+    """
+    with _MANIFEST_LOCK:
+        is_cached = manifest is _MANIFEST_CACHE["data"]
+        if is_cached and _MANIFEST_CACHE["version_index"] is not None:
+            return _MANIFEST_CACHE["version_index"]
+
+    version_index = {}
+    for version in manifest["versions"]:
+        # Keep the first entry for an id, matching a front-to-back search
+        version_index.setdefault(version["id"], version)
+
+    if is_cached:
+        with _MANIFEST_LOCK:
+            if manifest is _MANIFEST_CACHE["data"]:
+                _MANIFEST_CACHE["version_index"] = version_index
+    return version_index
 
 
 @handle_network_error
@@ -204,7 +407,7 @@ def get_version_info(version_id):
             raise NetworkError("Invalid manifest structure received")
 
         # Find the selected version's metadata URL
-        version_info = next((v for v in manifest["versions"] if v["id"] == version_id), None)
+        version_info = _get_version_index(manifest).get(version_id)
         if not version_info:
             available_versions = [
                 v["id"] for v in manifest["versions"][:10]
@@ -223,10 +426,10 @@ def get_version_info(version_id):
         logger.info(f"Fetching version metadata from: {version_metadata_url}")
 
         # Fetch the version-specific metadata file
-        version_metadata_response = requests.get(version_metadata_url, timeout=15)
+        version_metadata_response = _HTTP.get(version_metadata_url, timeout=15)
         version_metadata_response.raise_for_status()
 
-        metadata = version_metadata_response.json()
+        metadata = _loads(version_metadata_response.content)
 
         # Validate that the metadata contains required fields
         if not isinstance(metadata, dict) or "downloads" not in metadata:
@@ -238,7 +441,7 @@ def get_version_info(version_id):
         logger.info(f"Successfully fetched metadata for version {version_id}")
         return metadata
 
-    except requests.exceptions.JSONDecodeError as e:
+    except ValueError as e:
         error_msg = f"Invalid JSON response for version {version_id} metadata"
         logger.error(f"{error_msg}: {str(e)}")
         raise NetworkError(error_msg)
@@ -249,28 +452,107 @@ def get_version_info(version_id):
         raise NetworkError(f"Failed to get version information: {str(e)}")
 
 
+def is_admin_setup_exempt(endpoint):
+    """Check whether an endpoint stays reachable before the admin password is set."""
+    return endpoint in _ADMIN_SETUP_ALLOWED_ENDPOINTS or (
+        endpoint is not None and endpoint.startswith("static")
+    )
+
+
+def is_admin_password_set():
+    """
+    Check whether an admin account with a password exists.
+
+    Once an admin password is set it stays set for the life of the app, so a
+    positive answer is latched on the app and later calls skip the query.
+    """
+    if current_app.extensions.get(_ADMIN_PASSWORD_SET_KEY):
+        return True
+
+    admin_exists = (
+        db.session.query(User.id)
+        .filter(
+            User.is_admin.is_(True),
+            User.password_hash.isnot(None),
+            User.password_hash != "",
+        )
+        .first()
+        is not None
+    )
+    if admin_exists:
+        mark_admin_password_set()
+    return admin_exists
+
+
+def mark_admin_password_set():
+    """Record that the admin password has been set for the current app."""
+    current_app.extensions[_ADMIN_PASSWORD_SET_KEY] = True
+
+
+def reset_admin_password_cache():
+    """Forget the latched admin check so the next request queries again."""
+    current_app.extensions.pop(_ADMIN_PASSWORD_SET_KEY, None)
+
+
 def check_admin_password():
     """
     Check if admin password is set and redirect if needed.
     Enhanced with proper error handling and logging.
     """
     try:
-        admin_user = User.query.filter_by(username="admin").first()
-        if admin_user and not admin_user.password_hash:
-            allowed_endpoints = ["auth.set_admin_password", "static"]
-            current_endpoint = request.endpoint or ""
-
-            if current_endpoint not in allowed_endpoints and not current_endpoint.startswith(
-                "static"
-            ):
-                logger.info("Redirecting to admin password setup")
-                return redirect(url_for("auth.set_admin_password"))
+        if is_admin_setup_exempt(request.endpoint):
+            return None
+
+        if not is_admin_password_set():
+            logger.info("Redirecting to admin password setup")
+            return redirect(url_for("auth.set_admin_password"))
     except Exception as e:
         logger.error(f"Error checking admin password: {str(e)}")
         # Don't block the request if there's an error checking admin password
         return None
 
 
+def _safe_exclusion_path(filename):
+    """
+    Resolve an exclusion list filename, rejecting directory traversal.
+
+    Relative paths must stay inside the working directory once symlinks are
+    resolved; absolute paths are explicit.
+    """
+    path = Path(filename)
+    if ".." in path.parts:
+        raise ValidationError("Invalid file path - directory traversal not allowed")
+    target = path.resolve()
+    if not path.is_absolute():
+        base = Path.cwd().resolve()
+        if target != base and base not in target.parents:
+            raise ValidationError("Invalid file path - directory traversal not allowed")
+    return str(target)
+
+
+def _cached_exclusion_list(path):
+    """
+    Return ``(mtime, versions)`` for an exclusion list file.
+
+    A missing file is the common case for fresh installs, so it is answered
+    from the same stat call used for the cache check with an empty list.
+    ``versions`` is the cached list while the file is unchanged on disk, and
+    None when the file has to be read; ``mtime`` is None if it could not be
+    determined.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None, []
+    except OSError:
+        return None, None
+
+    cached = _EXCLUSION_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return mtime, cached[1]
+    return mtime, None
+
+
 def load_exclusion_list(filename="app/static/excluded_versions.json"):
     """
     Load the list of excluded Minecraft versions from JSON file.
@@ -279,16 +561,16 @@ def load_exclusion_list(filename="app/static/excluded_versions.json"):
     if not filename or not isinstance(filename, str):
         raise ValidationError("Invalid filename provided")
 
-    # Ensure the filename uses a safe path
-    safe_filename = os.path.normpath(filename)
-    if ".." in safe_filename:
-        raise ValidationError("Invalid file path - directory traversal not allowed")
+    safe_filename = _safe_exclusion_path(filename)
+    mtime, cached = _cached_exclusion_list(safe_filename)
+    if cached is not None:
+        return cached
 
     logger.info(f"Loading exclusion list from: {safe_filename}")
 
     try:
-        with SafeFileOperation(safe_filename, "r") as f:
-            excluded_versions = json.load(f)
+        with SafeFileOperation(safe_filename, "rb") as f:
+            excluded_versions = _loads(f.read())
 
         # Validate the loaded data
         if not isinstance(excluded_versions, list):
@@ -296,12 +578,18 @@ def load_exclusion_list(filename="app/static/excluded_versions.json"):
             return []
 
         # Validate each version string
-        valid_versions = []
-        for version in excluded_versions:
-            if isinstance(version, str) and version.strip():
-                valid_versions.append(version.strip())
-            else:
-                logger.warning(f"Invalid version entry in exclusion list: {version}")
+        valid_versions = [
+            stripped
+            for version in excluded_versions
+            if isinstance(version, str) and (stripped := version.strip())
+        ]
+        if len(valid_versions) != len(excluded_versions) and logger.isEnabledFor(logging.WARNING):
+            for version in excluded_versions:
+                if not (isinstance(version, str) and version.strip()):
+                    logger.warning(f"Invalid version entry in exclusion list: {version}")
+
+        if mtime is not None:
+            _EXCLUSION_CACHE[safe_filename] = (mtime, valid_versions)
 
         logger.info(f"Loaded {len(valid_versions)} excluded versions")
         return valid_versions
@@ -309,7 +597,7 @@ def load_exclusion_list(filename="app/static/excluded_versions.json"):
     except FileNotFoundError:
         logger.info(f"Exclusion list file not found: {safe_filename}, returning empty list")
         return []
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logger.error(f"Invalid JSON in exclusion list file: {str(e)}")
         raise FileOperationError(f"Invalid JSON format in exclusion list: {str(e)}")
     except Exception as e:
@@ -317,48 +605,63 @@ def load_exclusion_list(filename="app/static/excluded_versions.json"):
         raise FileOperationError(f"Failed to load exclusion list: {str(e)}")
 
 
+# Application settings used when the Configuration table has no row for a key
+_APP_CONFIG_DEFAULTS = {
+    "app_title": "Minecraft Server Manager",
+    "server_hostname": "localhost",
+    "max_total_mb": 8192,
+    "default_server_mb": 1024,
+    "min_server_mb": 512,
+    "max_server_mb": 4096,
+}
+_APP_CONFIG_INT_KEYS = frozenset(
+    key for key, value in _APP_CONFIG_DEFAULTS.items() if isinstance(value, int)
+)
+
+
 def get_app_config():
-    """Get application configuration from database."""
+    """
+    Get application configuration from database.
+
+    The result is memoized on flask.g, so repeated calls while handling one
+    request share a single Configuration query. update_app_config and
+    initialize_default_config drop the memoized copy after committing.
+    """
     try:
+        if "_app_config" in g:
+            return g._app_config
+
         from .models import Configuration
 
         # Get configuration from database
         config_entries = Configuration.query.all()
-        config = {}
 
+        # Start from the defaults and coerce numeric settings once here so the
+        # memoized dict hands callers ready-to-use ints
+        result = dict(_APP_CONFIG_DEFAULTS)
         for entry in config_entries:
-            config[entry.key] = entry.value
-
-        # Set defaults if not in database
-        app_title = config.get("app_title", "Minecraft Server Manager")
-        server_hostname = config.get("server_hostname", "localhost")
-        max_total_mb = int(config.get("max_total_mb", "8192"))
-        default_server_mb = int(config.get("default_server_mb", "1024"))
-        min_server_mb = int(config.get("min_server_mb", "512"))
-        max_server_mb = int(config.get("max_server_mb", "4096"))
-
-        result = {
-            "app_title": app_title,
-            "server_hostname": server_hostname,
-            "max_total_mb": max_total_mb,
-            "default_server_mb": default_server_mb,
-            "min_server_mb": min_server_mb,
-            "max_server_mb": max_server_mb,
-        }
-
-        logger.debug(f"App config from database: {result}")
+            if entry.key in _APP_CONFIG_INT_KEYS:
+                result[entry.key] = int(entry.value)
+            elif entry.key in result:
+                result[entry.key] = entry.value
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"App config from database: {result}")
+        g._app_config = result
         return result
     except Exception as e:
         logger.error(f"Error getting app config: {str(e)}")
         # Return safe defaults
-        return {
-            "app_title": "Minecraft Server Manager",
-            "server_hostname": "localhost",
-            "max_total_mb": 8192,
-            "default_server_mb": 1024,
-            "min_server_mb": 512,
-            "max_server_mb": 4096,
-        }
+        return dict(_APP_CONFIG_DEFAULTS)
+
+
+def _invalidate_app_config_cache():
+    """Discard the memoized app config for the current app context, if any."""
+    try:
+        g.pop("_app_config", None)
+    except RuntimeError:
+        # Working outside of application context
+        pass
 
 
 def get_memory_config():
@@ -378,25 +681,34 @@ def get_total_allocated_memory(user_id=None):
         if user_id is None:
             # Get total for all servers (admin view)
             total = db.session.query(db.func.sum(Server.memory_mb)).scalar() or 0
-            logger.debug(f"Total allocated memory across all servers: {total}MB")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Total allocated memory across all servers: {total}MB")
         else:
             # Get total for specific user
             total = (
                 db.session.query(db.func.sum(Server.memory_mb)).filter_by(owner_id=user_id).scalar()
                 or 0
             )
-            logger.debug(f"Total allocated memory for user {user_id}: {total}MB")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Total allocated memory for user {user_id}: {total}MB")
         return total
     except Exception as e:
         logger.error(f"Error getting total allocated memory: {str(e)}")
         return 0
 
 
-def get_available_memory(user_id=None):
-    """Get available memory based on total system memory and allocated memory."""
+def get_available_memory(user_id=None, config=None, allocated=None):
+    """
+    Get available memory based on total system memory and allocated memory.
+
+    Callers that already hold the memory config or allocated total can pass
+    them in to avoid repeating the configuration and SUM queries.
+    """
     try:
-        config = get_memory_config()
-        allocated = get_total_allocated_memory(user_id)
+        if config is None:
+            config = get_memory_config()
+        if allocated is None:
+            allocated = get_total_allocated_memory(user_id)
         available = config["max_total_mb"] - allocated
         return max(0, available)  # Don't return negative values
     except Exception as e:
@@ -426,12 +738,10 @@ def validate_memory_allocation(requested_memory_mb, exclude_server_id=None):
             return False, f"Memory cannot exceed {config['max_server_mb']}MB", 0
 
         # Calculate current allocation excluding the server being updated
-        current_allocation = 0
-        servers = Server.query.all()
-
-        for server in servers:
-            if exclude_server_id is None or server.id != exclude_server_id:
-                current_allocation += server.memory_mb
+        allocation_query = db.session.query(db.func.coalesce(db.func.sum(Server.memory_mb), 0))
+        if exclude_server_id is not None:
+            allocation_query = allocation_query.filter(Server.id != exclude_server_id)
+        current_allocation = allocation_query.scalar()
 
         # Check if new allocation would exceed total limit
         new_total = current_allocation + requested_memory_mb
@@ -464,57 +774,36 @@ def update_app_config(
         except (AttributeError, RuntimeError):
             user_id = None
 
-        # Update each configuration value
-        if app_title is not None:
-            config_entry = Configuration.query.filter_by(key="app_title").first()
-            if config_entry:
-                config_entry.value = str(app_title)
-                config_entry.updated_by = user_id
-            else:
-                config_entry = Configuration(
-                    key="app_title", value=str(app_title), updated_by=user_id
-                )
-                db.session.add(config_entry)
-
-        if server_hostname is not None:
-            config_entry = Configuration.query.filter_by(key="server_hostname").first()
-            if config_entry:
-                config_entry.value = str(server_hostname)
-                config_entry.updated_by = user_id
-            else:
-                config_entry = Configuration(
-                    key="server_hostname",
-                    value=str(server_hostname),
-                    updated_by=user_id,
-                )
-                db.session.add(config_entry)
+        updates = {
+            key: str(value)
+            for key, value in (
+                ("app_title", app_title),
+                ("server_hostname", server_hostname),
+                ("max_total_mb", max_total_mb),
+                ("max_server_mb", max_per_server_mb),
+            )
+            if value is not None
+        }
+        if not updates:
+            return True
 
-        if max_total_mb is not None:
-            config_entry = Configuration.query.filter_by(key="max_total_mb").first()
-            if config_entry:
-                config_entry.value = str(max_total_mb)
-                config_entry.updated_by = user_id
-            else:
-                config_entry = Configuration(
-                    key="max_total_mb", value=str(max_total_mb), updated_by=user_id
-                )
-                db.session.add(config_entry)
+        # Fetch every affected row in one round-trip instead of one per key
+        existing = {
+            entry.key: entry
+            for entry in Configuration.query.filter(Configuration.key.in_(updates)).all()
+        }
 
-        if max_per_server_mb is not None:
-            config_entry = Configuration.query.filter_by(key="max_server_mb").first()
+        for key, value in updates.items():
+            config_entry = existing.get(key)
             if config_entry:
-                config_entry.value = str(max_per_server_mb)
+                config_entry.value = value
                 config_entry.updated_by = user_id
             else:
-                config_entry = Configuration(
-                    key="max_server_mb",
-                    value=str(max_per_server_mb),
-                    updated_by=user_id,
-                )
-                db.session.add(config_entry)
+                db.session.add(Configuration(key=key, value=value, updated_by=user_id))
 
         # Commit changes to database
         db.session.commit()
+        _invalidate_app_config_cache()
 
         logger.info(
             f"App configuration updated in database: Title={app_title}, "
@@ -537,6 +826,10 @@ def update_memory_config(max_total_mb, max_per_server_mb):
 def format_memory_display(memory_mb):
     """Format memory in MB to human-readable format."""
     if memory_mb >= 1024:
+        # Whole gigabytes need no float division or format parsing
+        if isinstance(memory_mb, int) and not memory_mb & 1023:
+            return f"{memory_mb >> 10}.0GB"
+
         # Use decimal GB for amounts >= 1GB
         gb = memory_mb / 1024
         return f"{gb:.1f}GB"
@@ -548,15 +841,17 @@ def format_memory_display(memory_mb):
 def get_memory_usage_summary(user_id=None):
     """Get a summary of memory usage for display."""
     try:
-        config = get_memory_config()
+        # Config is memoized per request, so this costs at most one SUM query
+        config = get_app_config()
         # Always show total system allocation for all users
-        allocated = get_total_allocated_memory()  # No user_id - show total system
-        available = get_available_memory()  # No user_id - show total system
+        allocated = db.session.query(db.func.coalesce(db.func.sum(Server.memory_mb), 0)).scalar()
+        available = get_available_memory(config=config, allocated=allocated)
 
-        logger.debug(
-            f"Memory summary - Total: {config['max_total_mb']}MB, "
-            f"Allocated: {allocated}MB, Available: {available}MB"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Memory summary - Total: {config['max_total_mb']}MB, "
+                f"Allocated: {allocated}MB, Available: {available}MB"
+            )
 
         return {
             "total_memory_mb": config["max_total_mb"],
@@ -587,28 +882,30 @@ def initialize_default_config():
     try:
         from .models import Configuration
 
-        # Default configuration values
-        default_config = {
-            "app_title": "Minecraft Server Manager",
-            "server_hostname": "localhost",
-            "max_total_mb": "8192",
-            "default_server_mb": "1024",
-            "min_server_mb": "512",
-            "max_server_mb": "4096",
-        }
+        # Default configuration values, stored as strings like every other row
+        default_config = {key: str(value) for key, value in _APP_CONFIG_DEFAULTS.items()}
 
-        # Check which configurations exist and add missing ones
-        for key, value in default_config.items():
-            existing = Configuration.query.filter_by(key=key).first()
-            if not existing:
-                config_entry = Configuration(key=key, value=value, updated_by=None)
-                db.session.add(config_entry)
-                logger.info(f"Added default configuration: {key}={value}")
+        # Fetch all existing keys in one query and add the missing ones
+        existing_keys = {
+            key
+            for (key,) in db.session.query(Configuration.key)
+            .filter(Configuration.key.in_(default_config.keys()))
+            .all()
+        }
+        missing = [
+            Configuration(key=key, value=value, updated_by=None)
+            for key, value in default_config.items()
+            if key not in existing_keys
+        ]
 
-        # Commit any new configurations
-        if db.session.new:
+        if missing:
+            db.session.add_all(missing)
             db.session.commit()
-            logger.info("Default configuration initialized successfully")
+            _invalidate_app_config_cache()
+            logger.info(
+                f"Default configuration initialized successfully: "
+                f"added {', '.join(entry.key for entry in missing)}"
+            )
 
         return True
     except Exception as e:
@@ -617,6 +914,99 @@ def initialize_default_config():
         return False
 
 
+def _is_pid_alive(pid):
+    """
+    Check whether a PID currently exists, without reading anything from /proc.
+
+    Uses pidfd_open on Linux (Python 3.9+, kernel 5.3+) and falls back to
+    psutil.pid_exists elsewhere or when pidfds are unavailable.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return psutil.pid_exists(pid)
+
+    try:
+        fd = pidfd_open(pid)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Kernel without pidfd support, or the probe was refused
+        return psutil.pid_exists(pid)
+    os.close(fd)
+    return True
+
+
+def _is_running_java(pid):
+    """
+    Check whether a PID belongs to a running Java process.
+
+    Only the process name and command line are read, keeping this cheap
+    enough for reconciliation loops. Use describe_process for full details.
+
+    Args:
+        pid: Process ID to check
+
+    Returns:
+        tuple: (is_java, process_info) where process_info holds pid, name and
+        cmdline, or (False, None) if the process is not running
+
+    Raises:
+        psutil.NoSuchProcess, psutil.AccessDenied: If the process disappears
+        or cannot be inspected
+    """
+    process = psutil.Process(pid)
+    if not process.is_running():
+        return False, None
+
+    process_info = {
+        "pid": process.pid,
+        "name": process.name(),
+        "cmdline": process.cmdline(),
+    }
+
+    is_java = "java" in process_info["name"].lower() or any(
+        "java" in cmd.lower() for cmd in process_info["cmdline"]
+    )
+    return is_java, process_info
+
+
+_PROCESS_DETAIL_ATTRS = (
+    "pid",
+    "name",
+    "cmdline",
+    "cwd",
+    "create_time",
+    "memory_info",
+    "cpu_percent",
+    "status",
+)
+
+
+def describe_process(pid):
+    """
+    Get detailed information about a running process.
+
+    Args:
+        pid: Process ID to describe
+
+    Returns:
+        dict: Process details. Fields that cannot be read due to permissions
+        are reported as None.
+
+    Raises:
+        psutil.NoSuchProcess, psutil.AccessDenied: If the process disappears
+        or cannot be inspected
+    """
+    # The constructor already raises NoSuchProcess for a missing PID, so no
+    # separate is_running() probe is needed
+    process = psutil.Process(pid)
+
+    # oneshot() lets psutil read /proc/<pid>/stat once for name, create_time,
+    # cpu_percent and status instead of once per accessor
+    with process.oneshot():
+        return process.as_dict(attrs=_PROCESS_DETAIL_ATTRS)
+
+
 def verify_process_status(pid):
     """
     Verify if a process with the given PID is actually running.
@@ -631,51 +1021,31 @@ def verify_process_status(pid):
         if not pid:
             return {"is_running": False, "process_info": None, "error": None}
 
-        process = psutil.Process(pid)
-
-        # Check if process is running and get basic info
-        if process.is_running():
-            try:
-                # Get process details to verify it's a Java Minecraft server
-                process_info = {
-                    "pid": process.pid,
-                    "name": process.name(),
-                    "cmdline": process.cmdline(),
-                    "cwd": process.cwd(),
-                    "create_time": process.create_time(),
-                    "memory_info": process.memory_info(),
-                    "cpu_percent": process.cpu_percent(),
-                }
-
-                # Verify it's a Java process (basic validation)
-                if "java" in process_info["name"].lower() or any(
-                    "java" in cmd.lower() for cmd in process_info["cmdline"]
-                ):
-                    return {
-                        "is_running": True,
-                        "process_info": process_info,
-                        "error": None,
-                    }
-                else:
-                    return {
-                        "is_running": False,
-                        "process_info": process_info,
-                        "error": "Process is not a Java application",
-                    }
+        try:
+            is_java, process_info = _is_running_java(pid)
+        except psutil.AccessDenied:
+            return {
+                "is_running": False,
+                "process_info": None,
+                "error": "Access denied or process not found",
+            }
 
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                return {
-                    "is_running": False,
-                    "process_info": None,
-                    "error": "Access denied or process not found",
-                }
-        else:
+        if process_info is None:
             return {
                 "is_running": False,
                 "process_info": None,
                 "error": "Process is not running",
             }
 
+        # Verify it's a Java process (basic validation)
+        if is_java:
+            return {"is_running": True, "process_info": process_info, "error": None}
+        return {
+            "is_running": False,
+            "process_info": process_info,
+            "error": "Process is not a Java application",
+        }
+
     except psutil.NoSuchProcess:
         return {
             "is_running": False,
@@ -687,6 +1057,39 @@ def verify_process_status(pid):
         return {"is_running": False, "process_info": None, "error": str(e)}
 
 
+def _iter_java_processes():
+    """
+    Yield (pid, cmdline) for every running process whose name contains "java".
+
+    On Linux the process name is read from /proc/<pid>/comm first and the
+    command line is only read for Java processes, which skips most of the
+    per-process work psutil.process_iter does. Other platforms fall back to
+    psutil.
+    """
+    if not psutil.LINUX:
+        for process in psutil.process_iter(["pid", "name", "cmdline"]):
+            name = process.info["name"] or ""
+            if "java" in name.lower():
+                yield process.info["pid"], process.info["cmdline"]
+        return
+
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/comm", "rb") as f:
+                name = f.read().decode(errors="replace").strip()
+            if "java" not in name.lower():
+                continue
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                raw_cmdline = f.read()
+        except OSError:
+            # Process exited or is not readable
+            continue
+        cmdline = [arg.decode(errors="replace") for arg in raw_cmdline.split(b"\0") if arg]
+        yield int(entry), cmdline
+
+
 def find_orphaned_minecraft_processes():
     """
     Find orphaned Minecraft server processes that are running but not
@@ -698,46 +1101,46 @@ def find_orphaned_minecraft_processes():
     orphaned_processes = []
 
     try:
-        # Get all Java processes
-        for process in psutil.process_iter(["pid", "name", "cmdline", "cwd"]):
+        from .models import Server
+
+        # Load every managed PID once instead of querying per candidate process
+        managed_pids = {
+            pid for (pid,) in db.session.query(Server.pid).filter(Server.pid.isnot(None)).all()
+        }
+
+        for pid, cmdline in _iter_java_processes():
             try:
-                # Check if it's a Java process
-                if "java" in process.info["name"].lower():
-                    cmdline = process.info["cmdline"]
-
-                    # Check if it looks like a Minecraft server
-                    if (
-                        cmdline
-                        and len(cmdline) > 2
-                        and "server.jar" in " ".join(cmdline)
-                        and "nogui" in " ".join(cmdline)
-                    ):
-                        # Check if this process is managed by our app
-                        from .models import Server
-
-                        managed_server = Server.query.filter_by(pid=process.info["pid"]).first()
-
-                        if not managed_server:
-                            # This is an orphaned process
+                # Check if it looks like a Minecraft server, token by token
+                # rather than substring-scanning a joined classpath
+                if (
+                    cmdline
+                    and len(cmdline) > 2
+                    and "nogui" in cmdline
+                    and any(arg.endswith("server.jar") for arg in cmdline)
+                ):
+                    # Check if this process is managed by our app
+                    if pid not in managed_pids:
+                        # This is an orphaned process; only now pay for the
+                        # extra per-process lookups
+                        process = psutil.Process(pid)
+                        with process.oneshot():
                             orphaned_info = {
-                                "pid": process.info["pid"],
+                                "pid": pid,
                                 "cmdline": cmdline,
-                                "cwd": process.info["cwd"],
+                                "cwd": process.cwd(),
                                 "create_time": process.create_time(),
                                 "memory_info": process.memory_info(),
                             }
-                            orphaned_processes.append(orphaned_info)
-                            logger.warning(
-                                f"Found orphaned Minecraft process: "
-                                f"PID {process.info['pid']}, CWD: {process.info['cwd']}"
-                            )
+                        orphaned_processes.append(orphaned_info)
+                        logger.warning(
+                            f"Found orphaned Minecraft process: "
+                            f"PID {pid}, CWD: {orphaned_info['cwd']}"
+                        )
 
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
             except Exception as e:
-                logger.debug(
-                    f"Error checking process " f"{process.info.get('pid', 'unknown')}: {str(e)}"
-                )
+                logger.debug(f"Error checking process {pid}: {str(e)}")
                 continue
 
     except Exception as e:
@@ -746,6 +1149,18 @@ def find_orphaned_minecraft_processes():
     return orphaned_processes
 
 
+def _mark_servers_stopped(server_ids):
+    """Mark the given servers as stopped with a single UPDATE and commit."""
+    from .models import Server
+
+    try:
+        Server.query.filter(Server.id.in_(server_ids)).update({"status": "Stopped", "pid": None})
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+
 def reconcile_server_statuses():
     """
     Reconcile server statuses with actual running processes.
@@ -765,33 +1180,27 @@ def reconcile_server_statuses():
 
     try:
         # Check all servers marked as running
-        running_servers = Server.query.filter_by(status="Running").all()
+        # Only the columns needed for the process check are loaded
+        running_servers = (
+            Server.query.options(load_only(Server.id, Server.server_name, Server.pid))
+            .filter_by(status="Running")
+            .all()
+        )
         summary["servers_checked"] = len(running_servers)
 
+        stopped_servers = []
         for server in running_servers:
             try:
                 # Verify process status
                 process_status = verify_process_status(server.pid)
 
                 if not process_status["is_running"]:
-                    # Process is not running, update status
+                    # Process is not running, queue a status update
                     logger.info(
                         f"Server {server.server_name} (PID {server.pid}) "
                         f"is not running, updating status"
                     )
-
-                    try:
-                        server.status = "Stopped"
-                        server.pid = None
-                        db.session.commit()
-                        summary["statuses_updated"] += 1
-                        logger.info(f"Updated status for server {server.server_name}")
-                    except Exception as e:
-                        error_msg = (
-                            f"Failed to update status for server " f"{server.server_name}: {str(e)}"
-                        )
-                        logger.error(error_msg)
-                        summary["errors"].append(error_msg)
+                    stopped_servers.append(server)
 
                 else:
                     # Process is running, verify it's still valid
@@ -805,6 +1214,17 @@ def reconcile_server_statuses():
                 logger.error(error_msg)
                 summary["errors"].append(error_msg)
 
+        if stopped_servers:
+            names = ", ".join(server.server_name for server in stopped_servers)
+            try:
+                _mark_servers_stopped([server.id for server in stopped_servers])
+                summary["statuses_updated"] = len(stopped_servers)
+                logger.info(f"Updated status for servers: {names}")
+            except Exception as e:
+                error_msg = f"Failed to update status for servers {names}: {str(e)}"
+                logger.error(error_msg)
+                summary["errors"].append(error_msg)
+
         # Find orphaned processes
         orphaned = find_orphaned_minecraft_processes()
         summary["orphaned_processes_found"] = len(orphaned)
@@ -843,45 +1263,50 @@ def periodic_status_check():
 
     try:
         # Get all servers with PIDs
-        servers_with_pids = Server.query.filter(Server.pid.isnot(None)).all()
+        servers_with_pids = (
+            Server.query.options(load_only(Server.id, Server.server_name, Server.pid))
+            .filter(Server.pid.isnot(None))
+            .all()
+        )
         summary["servers_checked"] = len(servers_with_pids)
 
+        stopped_servers = []
         for server in servers_with_pids:
             try:
                 if not server.pid:
                     continue
 
-                # Check if process is still running
-                process_status = verify_process_status(server.pid)
+                # A cheap liveness probe settles dead PIDs; only PIDs still
+                # alive get the Java check, which catches PIDs reused by
+                # other programs
+                is_running = (
+                    _is_pid_alive(server.pid) and verify_process_status(server.pid)["is_running"]
+                )
 
-                if not process_status["is_running"]:
-                    # Process is not running, update status
+                if not is_running:
+                    # Process is not running, queue a status update
                     logger.info(
                         f"Periodic check: Server {server.server_name} "
                         f"(PID {server.pid}) is not running, updating status"
                     )
-
-                    try:
-                        server.status = "Stopped"
-                        server.pid = None
-                        db.session.commit()
-                        summary["statuses_updated"] += 1
-                        logger.info(
-                            f"Updated status for server {server.server_name} "
-                            f"during periodic check"
-                        )
-                    except Exception as e:
-                        error_msg = (
-                            f"Failed to update status for server " f"{server.server_name}: {str(e)}"
-                        )
-                        logger.error(error_msg)
-                        summary["errors"].append(error_msg)
+                    stopped_servers.append(server)
 
             except Exception as e:
                 error_msg = f"Error checking server {server.server_name}: {str(e)}"
                 logger.error(error_msg)
                 summary["errors"].append(error_msg)
 
+        if stopped_servers:
+            names = ", ".join(server.server_name for server in stopped_servers)
+            try:
+                _mark_servers_stopped([server.id for server in stopped_servers])
+                summary["statuses_updated"] = len(stopped_servers)
+                logger.info(f"Updated status for servers during periodic check: {names}")
+            except Exception as e:
+                error_msg = f"Failed to update status for servers {names}: {str(e)}"
+                logger.error(error_msg)
+                summary["errors"].append(error_msg)
+
         if summary["statuses_updated"] > 0:
             logger.info(
                 f"Periodic status check complete: "
@@ -910,26 +1335,13 @@ def get_server_process_info(server):
         return None
 
     try:
-        process = psutil.Process(server.pid)
-        if process.is_running():
-            return {
-                "pid": process.pid,
-                "name": process.name(),
-                "cmdline": process.cmdline(),
-                "cwd": process.cwd(),
-                "create_time": process.create_time(),
-                "memory_info": process.memory_info(),
-                "cpu_percent": process.cpu_percent(),
-                "status": process.status(),
-            }
+        return describe_process(server.pid)
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return None
     except Exception as e:
         logger.error(f"Error getting process info for server {server.server_name}: {str(e)}")
         return None
 
-    return None
-
 
 def calculate_file_checksums(filepath, algorithms=None):
     """
@@ -7,6 +7,7 @@ proper validation and environment variable loading.
 """
 
 import os
+from functools import lru_cache
 from typing import Type
 
 from .base import BaseConfig
@@ -14,6 +15,15 @@ from .development import DevelopmentConfig
 from .production import ProductionConfig
 from .testing import TestingConfig
 
+# Supported FLASK_ENV values, built once at import
+_CONFIG_MAP = {
+    "development": DevelopmentConfig,
+    "testing": TestingConfig,
+    "test": TestingConfig,
+    "production": ProductionConfig,
+    "prod": ProductionConfig,
+}
+
 
 def get_config() -> Type[BaseConfig]:
     """
@@ -25,20 +35,19 @@ def get_config() -> Type[BaseConfig]:
     Raises:
         ValueError: If FLASK_ENV is set to an unsupported value
     """
-    env = os.environ.get("FLASK_ENV", "development").lower()
+    return _config_for_env(os.environ.get("FLASK_ENV", "development"))
 
-    config_map = {
-        "development": DevelopmentConfig,
-        "testing": TestingConfig,
-        "test": TestingConfig,
-        "production": ProductionConfig,
-        "prod": ProductionConfig,
-    }
 
-    if env not in config_map:
-        raise ValueError(f"Unsupported FLASK_ENV: {env}. Must be one of: {list(config_map.keys())}")
+@lru_cache(maxsize=None)
+def _config_for_env(env: str) -> Type[BaseConfig]:
+    """Resolve a FLASK_ENV value to its configuration class, memoized per value."""
+    env = env.lower()
+    if env not in _CONFIG_MAP:
+        raise ValueError(
+            f"Unsupported FLASK_ENV: {env}. Must be one of: {list(_CONFIG_MAP.keys())}"
+        )
 
-    return config_map[env]
+    return _CONFIG_MAP[env]
 
 
 # Export the configuration classes for direct import if needed
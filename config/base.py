@@ -5,16 +5,35 @@ This module defines the base configuration class that contains all common
 configuration settings and validation logic.
 """
 
+import logging
 import os
 import secrets
+from functools import lru_cache
 from typing import Any, Dict
 
 
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to a default."""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+@lru_cache(maxsize=None)
+def _generated_secret_key() -> str:
+    """Generate a process-wide fallback secret key on first use."""
+    logging.getLogger(__name__).warning(
+        "SECRET_KEY is not set; generated a temporary key. Sessions will not "
+        "survive restarts or be shared between worker processes."
+    )
+    return secrets.token_hex(32)
+
+
 class BaseConfig:
     """Base configuration class with common settings and validation."""
 
     # Security Configuration
-    SECRET_KEY = os.environ.get("SECRET_KEY") or secrets.token_hex(32)
+    # Resolved through get_secret_key() so a fallback is only generated when needed
+    SECRET_KEY = os.environ.get("SECRET_KEY")
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or "sqlite:///minecraft_manager.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
@@ -60,6 +79,7 @@ class BaseConfig:
     PASSWORD_REQUIRE_LOWERCASE = True
     PASSWORD_REQUIRE_DIGITS = True
     PASSWORD_REQUIRE_SPECIAL = False  # Optional for hobbyist use
+    PASSWORD_HASH_METHOD = "scrypt"  # Werkzeug method string for new password hashes
 
     # Account Security
     MAX_LOGIN_ATTEMPTS = 5
@@ -74,17 +94,26 @@ class BaseConfig:
     APP_TITLE = os.environ.get("APP_TITLE", "Minecraft Server Manager")
     SERVER_HOSTNAME = os.environ.get("SERVER_HOSTNAME", "localhost")
 
+    # Version manifest cache file, relative to the instance folder (empty disables)
+    VERSION_MANIFEST_CACHE_FILE = os.environ.get(
+        "VERSION_MANIFEST_CACHE_FILE", "version_manifest_cache.json"
+    )
+
     # Memory Management Configuration
-    MAX_TOTAL_MEMORY_MB = int(os.environ.get("MAX_TOTAL_MEMORY_MB", "8192"))  # Default 8GB total
-    DEFAULT_SERVER_MEMORY_MB = int(
-        os.environ.get("DEFAULT_SERVER_MEMORY_MB", "1024")
-    )  # Default 1GB per server
-    MIN_SERVER_MEMORY_MB = int(
-        os.environ.get("MIN_SERVER_MEMORY_MB", "512")
-    )  # Minimum 512MB per server
-    MAX_SERVER_MEMORY_MB = int(
-        os.environ.get("MAX_SERVER_MEMORY_MB", "4096")
-    )  # Maximum 4GB per server
+    MAX_TOTAL_MEMORY_MB = _env_int("MAX_TOTAL_MEMORY_MB", 8192)  # Default 8GB total
+    DEFAULT_SERVER_MEMORY_MB = _env_int("DEFAULT_SERVER_MEMORY_MB", 1024)  # Default 1GB per server
+    MIN_SERVER_MEMORY_MB = _env_int("MIN_SERVER_MEMORY_MB", 512)  # Minimum 512MB per server
+    MAX_SERVER_MEMORY_MB = _env_int("MAX_SERVER_MEMORY_MB", 4096)  # Maximum 4GB per server
+
+    @classmethod
+    def get_secret_key(cls) -> str:
+        """
+        Get the configured secret key, generating a temporary one if unset.
+
+        Returns:
+            str: Secret key for signing sessions and CSRF tokens
+        """
+        return cls.SECRET_KEY or _generated_secret_key()
 
     @classmethod
     def validate_config(cls) -> Dict[str, Any]:
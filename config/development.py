@@ -7,7 +7,7 @@ configuration for local development environments.
 
 import os
 
-from .base import BaseConfig
+from .base import BaseConfig, _env_int
 
 
 class DevelopmentConfig(BaseConfig):
@@ -31,12 +31,10 @@ class DevelopmentConfig(BaseConfig):
     RATELIMIT_LOGIN_WINDOW = 300  # 5 minutes
 
     # Development-specific memory settings (smaller for local testing)
-    MAX_TOTAL_MEMORY_MB = int(os.environ.get("MAX_TOTAL_MEMORY_MB", "2048"))  # 2GB for dev
-    DEFAULT_SERVER_MEMORY_MB = int(
-        os.environ.get("DEFAULT_SERVER_MEMORY_MB", "512")
-    )  # 512MB for dev
-    MIN_SERVER_MEMORY_MB = int(os.environ.get("MIN_SERVER_MEMORY_MB", "256"))  # 256MB min for dev
-    MAX_SERVER_MEMORY_MB = int(os.environ.get("MAX_SERVER_MEMORY_MB", "1024"))  # 1GB max for dev
+    MAX_TOTAL_MEMORY_MB = _env_int("MAX_TOTAL_MEMORY_MB", 2048)  # 2GB for dev
+    DEFAULT_SERVER_MEMORY_MB = _env_int("DEFAULT_SERVER_MEMORY_MB", 512)  # 512MB for dev
+    MIN_SERVER_MEMORY_MB = _env_int("MIN_SERVER_MEMORY_MB", 256)  # 256MB min for dev
+    MAX_SERVER_MEMORY_MB = _env_int("MAX_SERVER_MEMORY_MB", 1024)  # 1GB max for dev
 
     # Development logging
     LOG_LEVEL = "DEBUG"
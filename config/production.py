@@ -7,7 +7,7 @@ and performance optimizations for production deployment.
 
 import os
 
-from .base import BaseConfig
+from .base import BaseConfig, _env_int
 
 
 class ProductionConfig(BaseConfig):
@@ -30,12 +30,10 @@ class ProductionConfig(BaseConfig):
     RATELIMIT_LOGIN = "3 per minute"
 
     # Production memory settings (configurable via environment)
-    MAX_TOTAL_MEMORY_MB = int(os.environ.get("MAX_TOTAL_MEMORY_MB", "16384"))  # 16GB default
-    DEFAULT_SERVER_MEMORY_MB = int(
-        os.environ.get("DEFAULT_SERVER_MEMORY_MB", "2048")
-    )  # 2GB default
-    MIN_SERVER_MEMORY_MB = int(os.environ.get("MIN_SERVER_MEMORY_MB", "1024"))  # 1GB minimum
-    MAX_SERVER_MEMORY_MB = int(os.environ.get("MAX_SERVER_MEMORY_MB", "8192"))  # 8GB maximum
+    MAX_TOTAL_MEMORY_MB = _env_int("MAX_TOTAL_MEMORY_MB", 16384)  # 16GB default
+    DEFAULT_SERVER_MEMORY_MB = _env_int("DEFAULT_SERVER_MEMORY_MB", 2048)  # 2GB default
+    MIN_SERVER_MEMORY_MB = _env_int("MIN_SERVER_MEMORY_MB", 1024)  # 1GB minimum
+    MAX_SERVER_MEMORY_MB = _env_int("MAX_SERVER_MEMORY_MB", 8192)  # 8GB maximum
 
     # Production logging
     LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
@@ -52,9 +50,7 @@ class ProductionConfig(BaseConfig):
     }
 
     # Production file upload settings
-    MAX_CONTENT_LENGTH = int(
-        os.environ.get("MAX_CONTENT_LENGTH", str(32 * 1024 * 1024))
-    )  # 32MB default
+    MAX_CONTENT_LENGTH = _env_int("MAX_CONTENT_LENGTH", 32 * 1024 * 1024)  # 32MB default
 
     # Production-specific security settings
     PASSWORD_REQUIRE_SPECIAL = True  # Require special characters in production
@@ -67,6 +63,21 @@ class ProductionConfig(BaseConfig):
     # Production error handling
     PROPAGATE_EXCEPTIONS = False  # Don't expose internal errors
 
+    @classmethod
+    def get_secret_key(cls) -> str:
+        """
+        Get the configured secret key, refusing to fall back to a generated one.
+
+        Returns:
+            str: Secret key for signing sessions and CSRF tokens
+
+        Raises:
+            ValueError: If SECRET_KEY is not set in the environment
+        """
+        if not cls.SECRET_KEY:
+            raise ValueError("SECRET_KEY must be set in production")
+        return cls.SECRET_KEY
+
     # Production-specific validation
     @classmethod
     def validate_production_config(cls) -> dict:
@@ -46,6 +46,9 @@ class TestingConfig(BaseConfig):
     TESTING_MODE = True
     PRESERVE_CONTEXT_ON_EXCEPTION = False
 
+    # Keep the version manifest cache in memory only
+    VERSION_MANIFEST_CACHE_FILE = None
+
     # Use temporary directory for test files
     TEST_UPLOAD_FOLDER = tempfile.mkdtemp()
 
@@ -57,3 +60,6 @@ class TestingConfig(BaseConfig):
 
     # Disable password expiry for tests
     PASSWORD_EXPIRY_DAYS = 0  # No expiry in tests
+
+    # A single PBKDF2 round; tests only need hashes that verify
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
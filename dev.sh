@@ -172,6 +172,7 @@ show_usage() {
     echo "  --quiet, -q         Run tests with quiet output"
     echo "  --tb=STYLE          Set traceback style (short, long, auto, line, native)"
     echo "  --maxfail=NUM       Stop after NUM failures"
+    echo "  --jobs=N            Run tests across N pytest-xdist workers (N or 'auto')"
     echo "  --markers           Show available pytest markers"
     echo ""
     echo "TROUBLESHOOTING:"
@@ -211,6 +212,7 @@ show_usage() {
     echo "  $0 test --pytest-args "-m 'not slow' --maxfail=5"   # Run with markers and max failures"
     echo "  $0 test --file test_server_management.py --pytest-args "-v --tb=long"  # Run specific file with options"
     echo "  $0 test --unit --pytest-args "--cov=app --cov-report=html"  # Run unit tests with coverage"
+    echo "  $0 test --unit --jobs=auto                    # Run unit tests on all CPU cores"
     echo "  $0 test --verbose                                    # Run with verbose output"
     echo "  $0 test --quiet                                      # Run with quiet output"
     echo "  $0 test --tb=short                                   # Run with short traceback style"
@@ -301,6 +303,7 @@ run_tests() {
     local quiet=false
     local tb_style=""
     local maxfail=""
+    local jobs=""
 
     # Parse test arguments
     while [[ $# -gt 0 ]]; do
@@ -365,6 +368,10 @@ run_tests() {
                 maxfail="${1#--maxfail=}"
                 shift
                 ;;
+            --jobs=*)
+                jobs="${1#--jobs=}"
+                shift
+                ;;
             --markers)
                 pytest_args="$pytest_args --markers"
                 shift
@@ -406,6 +413,16 @@ run_tests() {
     if [ -n "$maxfail" ]; then
         final_pytest_args="$final_pytest_args --maxfail=$maxfail"
     fi
+    # Parallel runs are opt-in: each worker builds its own app and schema, and on
+    # this suite that startup cost cancels out the gain from extra workers.
+    # loadfile keeps each module's tests on a single worker.
+    if [ -n "$jobs" ]; then
+        if python -c "import xdist" >/dev/null 2>&1; then
+            final_pytest_args="$final_pytest_args -n $jobs --dist=loadfile"
+        else
+            print_warning "pytest-xdist not installed, running tests serially"
+        fi
+    fi
     if [ -n "$pytest_args" ]; then
         final_pytest_args="$final_pytest_args $pytest_args"
     fi
@@ -785,7 +802,7 @@ main() {
                     break
                 fi
                 ;;
-            --unit|--integration|--e2e|--performance|--file|--class|--function|--pattern|--list|--pytest-args|--verbose|-v|--quiet|-q|--tb=*|--maxfail=*|--markers)
+            --unit|--integration|--e2e|--performance|--file|--class|--function|--pattern|--list|--pytest-args|--verbose|-v|--quiet|-q|--tb=*|--maxfail=*|--jobs=*|--markers)
                 # These are test-specific options, only valid after 'test' command
                 if [ "$command" != "test" ]; then
                     print_error "Option $1 is only valid with 'test' command"
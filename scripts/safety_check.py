@@ -2,13 +2,34 @@
 """
 Safety check script for pre-commit hook
 """
+import hashlib
 import subprocess
 import sys
+import time
+from pathlib import Path
+
+REQUIREMENTS_FILES = ("requirements.txt", "requirements-dev.txt")
+
+# Hash of the last requirements set that passed; only kept inside a git checkout
+CACHE_FILE = Path(".git") / "safety_cache"
+
+
+def requirements_hash():
+    """Hash the requirements files, salted with the month so scans rerun periodically"""
+    digest = hashlib.sha256(time.strftime("%Y%m").encode())
+    for name in REQUIREMENTS_FILES:
+        digest.update(Path(name).read_bytes())
+    return digest.hexdigest()
 
 
 def main():
     """Run safety check on requirements files"""
     try:
+        current_hash = requirements_hash()
+        if CACHE_FILE.is_file() and CACHE_FILE.read_text().strip() == current_hash:
+            print("safety: cached OK")
+            sys.exit(0)
+
         # Run safety check on both requirements files
         result = subprocess.run(
             [
@@ -28,6 +49,9 @@ def main():
         if result.stderr:
             print(result.stderr, file=sys.stderr)
 
+        if result.returncode == 0 and CACHE_FILE.parent.is_dir():
+            CACHE_FILE.write_text(current_hash)
+
         sys.exit(result.returncode)
     except Exception as e:
         print(f"Error running safety: {e}", file=sys.stderr)
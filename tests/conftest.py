@@ -1,24 +1,29 @@
 """
 Pytest configuration and fixtures for the Minecraft Server Manager tests.
 
-This module provides the main test configuration and imports all fixture modules
-to ensure proper test setup and isolation.
+This module provides the main test configuration and registers all fixture modules
+as plugins to ensure proper test setup and isolation.
 """
-import pytest
+import logging
+import os
 
-# Import all fixture modules to make them available to tests
-from tests.fixtures import clients, database, mocks, server_files, servers, users, utilities
-from tests.fixtures.clients import (
-    authenticated_client,
-    authenticated_inactive_client,
-    authenticated_regular_client,
-    client,
-    client_no_admin,
-    unauthenticated_client,
-)
+# Point the app at an in-memory database before anything imports the config
+# classes, so a run without pytest-env never touches a developer's database
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
-# Re-export key fixtures from database module for backward compatibility
-from tests.fixtures.database import app, app_no_admin, clean_db
-from tests.fixtures.servers import running_server, test_server
-from tests.fixtures.users import admin_user, inactive_user, regular_user
-from tests.fixtures.utilities import runner, temp_backup_dir, temp_data_dir, temp_server_dir
+# Keep SQL statement and request logging quiet even if a handler is attached, so
+# queries and test-client requests are not formatted into log records
+logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
+logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+# Fixture modules are registered as plugins so pytest discovers their fixtures
+# directly instead of them being re-imported into this module's namespace
+pytest_plugins = [
+    "tests.fixtures.clients",
+    "tests.fixtures.database",
+    "tests.fixtures.mocks",
+    "tests.fixtures.server_files",
+    "tests.fixtures.servers",
+    "tests.fixtures.users",
+    "tests.fixtures.utilities",
+]
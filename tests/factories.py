@@ -4,13 +4,27 @@ Factory pattern for generating test data in the Minecraft Server Manager tests.
 This module provides factory classes for creating test data objects with
 sensible defaults and the ability to override specific attributes.
 """
+import functools
+import itertools
 import random
 import string
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from werkzeug.security import generate_password_hash
 
 from app.models import Server, User
+from config.testing import TestingConfig
+
+# Sequences for generated names and ports, so generated values never collide
+_user_seq = itertools.count(1)
+_server_seq = itertools.count(1)
+_port_seq = itertools.cycle(range(25565, 26566))
+
+
+@functools.lru_cache(maxsize=None)
+def _hash_password(password: str) -> str:
+    """Hash each distinct test password once; the factory reuses the result."""
+    return generate_password_hash(password, method=TestingConfig.PASSWORD_HASH_METHOD)
 
 
 class UserFactory:
@@ -22,6 +36,7 @@ class UserFactory:
         password: str = "testpass123",
         is_admin: bool = False,
         is_active: bool = True,
+        randomize: bool = False,
         **kwargs,
     ) -> User:
         """
@@ -32,17 +47,19 @@ class UserFactory:
             password: Password for the user
             is_admin: Whether the user is an admin
             is_active: Whether the user is active
+            randomize: Generate the username randomly instead of from the sequence
             **kwargs: Additional attributes to set on the user
 
         Returns:
             User instance with test data
         """
         if username is None:
-            username = f"testuser_{random.randint(1000, 9999)}"
+            user_number = random.randint(1000, 9999) if randomize else next(_user_seq)
+            username = f"testuser_{user_number}"
 
         user_data = {
             "username": username,
-            "password_hash": generate_password_hash(password),  # pragma: allowlist secret
+            "password_hash": _hash_password(password),  # pragma: allowlist secret
             "is_admin": is_admin,
             "is_active": is_active,
             **kwargs,
@@ -89,6 +106,7 @@ class ServerFactory:
         status: str = "Stopped",
         owner_id: Optional[int] = None,
         memory_mb: int = 1024,
+        randomize: bool = False,
         **kwargs,
     ) -> Server:
         """
@@ -101,16 +119,19 @@ class ServerFactory:
             status: Server status
             owner_id: ID of the user who owns the server
             memory_mb: Memory allocation in MB
+            randomize: Generate the name, port and seed randomly instead of from
+                the sequences (values may then collide)
             **kwargs: Additional attributes to set on the server
 
         Returns:
             Server instance with test data
         """
+        server_number = random.randint(1000, 9999) if randomize else next(_server_seq)
         if server_name is None:
-            server_name = f"testserver_{random.randint(1000, 9999)}"
+            server_name = f"testserver_{server_number}"
 
         if port is None:
-            port = random.randint(25565, 26565)
+            port = generate_random_port() if randomize else next(_port_seq)
 
         server_data = {
             "server_name": server_name,
@@ -118,7 +139,7 @@ class ServerFactory:
             "port": port,
             "status": status,
             "pid": None,
-            "level_seed": f"seed_{random.randint(1000, 9999)}",
+            "level_seed": f"seed_{server_number}",
             "gamemode": "survival",
             "difficulty": "normal",
             "hardcore": False,
@@ -197,6 +218,15 @@ class ServerFactory:
         )
 
 
+def _bulk_save(session, users: List[User], servers: List[Server], owners: List[User]) -> None:
+    """Bulk-insert users, then their servers with ``owner_id`` filled in, and commit."""
+    session.bulk_save_objects(users, return_defaults=True)
+    for server, owner in zip(servers, owners):
+        server.owner_id = owner.id
+    session.bulk_save_objects(servers, return_defaults=True)
+    session.commit()
+
+
 class TestDataFactory:
     """Factory for creating complex test data scenarios."""
 
@@ -205,6 +235,7 @@ class TestDataFactory:
         user_count: int = 1,
         servers_per_user: int = 2,
         admin_users: int = 0,
+        session=None,
     ) -> Dict[str, Any]:
         """
         Create multiple users with multiple servers each.
@@ -213,12 +244,14 @@ class TestDataFactory:
             user_count: Number of regular users to create
             servers_per_user: Number of servers per user
             admin_users: Number of admin users to create
+            session: Session to bulk-insert and commit the data with (optional)
 
         Returns:
             Dictionary containing users and servers lists
         """
         users = []
         servers = []
+        owners = []
 
         # Create admin users
         for i in range(admin_users):
@@ -232,6 +265,7 @@ class TestDataFactory:
                     owner_id=admin.id,
                 )
                 servers.append(server)
+                owners.append(admin)
 
         # Create regular users
         for i in range(user_count):
@@ -245,6 +279,10 @@ class TestDataFactory:
                     owner_id=user.id,
                 )
                 servers.append(server)
+                owners.append(user)
+
+        if session is not None:
+            _bulk_save(session, users, servers, owners)
 
         return {"users": users, "servers": servers}
 
@@ -252,6 +290,7 @@ class TestDataFactory:
     def create_memory_test_scenario(
         total_memory_mb: int = 8192,
         server_count: int = 5,
+        session=None,
     ) -> Dict[str, Any]:
         """
         Create a test scenario for memory management testing.
@@ -259,6 +298,7 @@ class TestDataFactory:
         Args:
             total_memory_mb: Total available memory
             server_count: Number of servers to create
+            session: Session to bulk-insert and commit the data with (optional)
 
         Returns:
             Dictionary containing users, servers, and memory info
@@ -281,6 +321,9 @@ class TestDataFactory:
             )
             servers.append(server)
 
+        if session is not None:
+            _bulk_save(session, users, servers, [admin] * len(servers))
+
         return {
             "users": users,
             "servers": servers,
@@ -4,15 +4,71 @@ Database-related test fixtures.
 This module provides fixtures for database setup, teardown, and state management
 in tests.
 """
-import os
-import tempfile
 from contextlib import contextmanager
 from typing import Generator
 
 import pytest
+from flask import Flask
+from werkzeug.security import generate_password_hash
 
 from app import create_app
 from app.extensions import db
+from app.models import ExperimentalFeature, User
+from config.testing import TestingConfig
+
+# Hash the default admin password once per run, with the cheap test method
+_ADMIN_PASSWORD_HASH = generate_password_hash(
+    "adminpass", method=TestingConfig.PASSWORD_HASH_METHOD  # pragma: allowlist secret
+)
+
+
+TEST_CONFIG = {
+    "TESTING": True,
+    "SECRET_KEY": "test-secret-key-for-testing-only",  # pragma: allowlist secret
+    "WTF_CSRF_ENABLED": False,  # Disable CSRF for testing
+    "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+    "RATELIMIT_ENABLED": False,  # Disable rate limiting for testing
+    "APP_TITLE": "Minecraft Server Manager Test",
+    "SERVER_HOSTNAME": "localhost",
+    "MAX_TOTAL_MEMORY_MB": "8192",
+    "DEFAULT_SERVER_MEMORY_MB": "1024",
+    "MIN_SERVER_MEMORY_MB": "512",
+    "MAX_SERVER_MEMORY_MB": "4096",
+    "VERSION_MANIFEST_CACHE_FILE": None,
+    "PASSWORD_HASH_METHOD": TestingConfig.PASSWORD_HASH_METHOD,
+}
+
+
+@pytest.fixture(scope="session")
+def _app_state():
+    """Create the test app and its schema once per session.
+
+    Returns the app with snapshots of ``app.config`` and ``app.extensions``
+    (which latches values such as the admin-password check) so each test can
+    start from the same state.
+    """
+    app = create_app()
+    app.config.update(TEST_CONFIG)
+    with app.app_context():
+        db.create_all()
+    return app, dict(app.config), dict(app.extensions)
+
+
+def _reset_app(app_state):
+    """Restore the session app's configuration and extension state."""
+    app, config_snapshot, extensions_snapshot = app_state
+    app.config.clear()
+    app.config.update(config_snapshot)
+    app.extensions.clear()
+    app.extensions.update(extensions_snapshot)
+    return app
+
+
+def _clear_tables():
+    """Delete every row, children first, leaving the session schema in place."""
+    for table in reversed(db.metadata.sorted_tables):
+        db.session.execute(table.delete())
+    db.session.commit()
 
 
 @contextmanager
@@ -20,124 +76,69 @@ def app_context_with_cleanup(app) -> Generator[None, None, None]:
     """Context manager for Flask app context with proper cleanup."""
     with app.app_context():
         try:
-            # Ensure clean database state
-            db.drop_all()
-            db.create_all()
+            # The schema is created once per session; only the rows are reset
+            _clear_tables()
             yield
         finally:
             # Clean up any pending transactions
             db.session.rollback()
-            db.drop_all()
 
 
-@pytest.fixture
-def app():
-    """Create and configure a new app instance for each test."""
-    # Create a temporary file for the test database
-    db_fd, db_path = tempfile.mkstemp()
-
-    # Set test configuration
-    test_config = {
-        "TESTING": True,
-        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
-        "SECRET_KEY": "test-secret-key-for-testing-only",  # pragma: allowlist secret
-        "WTF_CSRF_ENABLED": False,  # Disable CSRF for testing
-        "SQLALCHEMY_TRACK_MODIFICATIONS": False,
-        "RATELIMIT_ENABLED": False,  # Disable rate limiting for testing
-        "APP_TITLE": "Minecraft Server Manager Test",
-        "SERVER_HOSTNAME": "localhost",
-        "MAX_TOTAL_MEMORY_MB": "8192",
-        "DEFAULT_SERVER_MEMORY_MB": "1024",
-        "MIN_SERVER_MEMORY_MB": "512",
-        "MAX_SERVER_MEMORY_MB": "4096",
-    }
-
-    # Create app with test config
-    app = create_app()
-    app.config.update(test_config)
+def _seed_defaults():
+    """Insert the default admin user and experimental feature flag."""
+    admin_user = User(
+        username="admin",
+        password_hash=_ADMIN_PASSWORD_HASH,
+        is_admin=True,
+        is_active=True,
+    )
+    db.session.add(admin_user)
 
-    with app_context_with_cleanup(app):
-        # Create a default admin user to prevent admin setup redirects in tests
-        from werkzeug.security import generate_password_hash
-
-        from app.models import User
-
-        admin_user = User(
-            username="admin",
-            password_hash=generate_password_hash("adminpass"),  # pragma: allowlist secret
-            is_admin=True,
-            is_active=True,
-        )
-        db.session.add(admin_user)
-
-        # Create default experimental feature flags for testing
-        from app.models import ExperimentalFeature
-
-        # Check if the feature already exists to avoid UNIQUE constraint errors
-        existing_feature = ExperimentalFeature.query.filter_by(
-            feature_key="server_management_page"
-        ).first()
-        if not existing_feature:
-            server_management_feature = ExperimentalFeature(
-                feature_key="server_management_page",
-                feature_name="Server Management Page",
-                description="Enable the enhanced server management page with console integration",
-                enabled=True,  # Default to enabled for tests
-                is_stable=False,
-                updated_by=None,
-            )
-            db.session.add(server_management_feature)
-
-        db.session.commit()
+    server_management_feature = ExperimentalFeature(
+        feature_key="server_management_page",
+        feature_name="Server Management Page",
+        description="Enable the enhanced server management page with console integration",
+        enabled=True,  # Default to enabled for tests
+        is_stable=False,
+        updated_by=None,
+    )
+    db.session.add(server_management_feature)
 
-        yield app
+    db.session.commit()
 
-    # Clean up
-    os.close(db_fd)
-    os.unlink(db_path)
 
-
-@pytest.fixture
-def app_no_admin():
-    """Create and configure a new app instance for each test without admin user."""
-    # Create a temporary file for the test database
-    db_fd, db_path = tempfile.mkstemp()
-
-    # Set test configuration
-    test_config = {
-        "TESTING": True,
-        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
-        "SECRET_KEY": "test-secret-key-for-testing-only",  # pragma: allowlist secret
-        "WTF_CSRF_ENABLED": False,  # Disable CSRF for testing
-        "SQLALCHEMY_TRACK_MODIFICATIONS": False,
-        "RATELIMIT_ENABLED": False,  # Disable rate limiting for testing
-        "APP_TITLE": "Minecraft Server Manager Test",
-        "SERVER_HOSTNAME": "localhost",
-        "MAX_TOTAL_MEMORY_MB": "8192",
-        "DEFAULT_SERVER_MEMORY_MB": "1024",
-        "MIN_SERVER_MEMORY_MB": "512",
-        "MAX_SERVER_MEMORY_MB": "4096",
-    }
-
-    # Create app with test config
-    app = create_app()
-    app.config.update(test_config)
+@contextmanager
+def _make_app(app_state, create_admin: bool) -> Generator[Flask, None, None]:
+    """Yield the reset session app, optionally seeded with the default admin."""
+    app = _reset_app(app_state)
 
     with app_context_with_cleanup(app):
-        # Don't create admin user - for tests that need to test admin setup
+        if create_admin:
+            # A default admin user prevents admin setup redirects in tests
+            _seed_defaults()
         yield app
 
-    # Clean up
-    os.close(db_fd)
-    os.unlink(db_path)
+
+@pytest.fixture
+def app(_app_state):
+    """Provide the session app with a freshly reset database for each test."""
+    with _make_app(_app_state, create_admin=True) as app:
+        yield app
+
+
+@pytest.fixture
+def app_no_admin(_app_state):
+    """Provide the session app with a freshly reset database and no admin user."""
+    # Don't create admin user - for tests that need to test admin setup
+    with _make_app(_app_state, create_admin=False) as app:
+        yield app
 
 
 @pytest.fixture
 def clean_db(app):
     """Ensure database is clean before each test."""
     with app.app_context():
-        db.drop_all()
-        db.create_all()
+        _clear_tables()
         yield
         db.session.rollback()
 
@@ -155,37 +156,12 @@ def clean_test_environment(app):
     """Ensure a completely clean test environment with proper setup."""
     with app.app_context():
         # Clean database state
-        db.drop_all()
-        db.create_all()
-
-        # Create admin user
-        from werkzeug.security import generate_password_hash
-
-        from app.models import ExperimentalFeature, User
-
-        admin_user = User(
-            username="admin",
-            password_hash=generate_password_hash("adminpass"),  # pragma: allowlist secret
-            is_admin=True,
-            is_active=True,
-        )
-        db.session.add(admin_user)
-
-        # Create default experimental feature
-        server_management_feature = ExperimentalFeature(
-            feature_key="server_management_page",
-            feature_name="Server Management Page",
-            description="Enable the enhanced server management page with console integration",
-            enabled=True,
-            is_stable=False,
-            updated_by=None,
-        )
-        db.session.add(server_management_feature)
+        _clear_tables()
 
-        db.session.commit()
+        # Create admin user and default experimental feature
+        _seed_defaults()
 
         yield app
 
         # Cleanup after test
         db.session.rollback()
-        db.drop_all()
@@ -4,6 +4,7 @@ Mock fixtures for external dependencies.
 This module provides comprehensive mock objects for testing external dependencies
 like network requests, file system operations, and subprocess calls.
 """
+import errno
 import json
 import subprocess
 import tempfile
@@ -58,7 +59,7 @@ def mock_requests_failure():
 @pytest.fixture
 def mock_minecraft_version_api():
     """Mock Minecraft version API responses."""
-    with patch("requests.get") as mock_get:
+    with patch("app.utils._HTTP.get") as mock_get:
         # Mock version manifest
         manifest_response = MagicMock(spec=requests.Response)
         manifest_response.status_code = 200
@@ -104,6 +105,8 @@ def mock_minecraft_version_api():
             else:
                 return version_response
 
+        manifest_response.content = json.dumps(manifest_response.json.return_value).encode()
+        version_response.content = json.dumps(version_response.json.return_value).encode()
         mock_get.side_effect = mock_get_side_effect
 
         yield {
@@ -206,7 +209,8 @@ def mock_socket_operations():
     """Mock socket operations for port testing."""
     with patch("socket.socket") as mock_socket:
         mock_sock = MagicMock()
-        mock_sock.connect_ex.return_value = 0  # Port in use by default
+        # Port in use by default
+        mock_sock.bind.side_effect = OSError(errno.EADDRINUSE, "Address already in use")
         mock_sock.__enter__.return_value = mock_sock
         mock_sock.__exit__.return_value = None
         mock_socket.return_value = mock_sock
@@ -418,7 +422,7 @@ def comprehensive_mock_setup():
         mock_process.pid = 12345
 
         mock_sock = MagicMock()
-        mock_sock.connect_ex.return_value = 1  # Port available
+        mock_sock.bind.return_value = None  # Port available
 
         mock_get.return_value = mock_response
         mock_popen.return_value = mock_process
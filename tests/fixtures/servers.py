@@ -5,6 +5,8 @@ This module provides fixtures for creating and managing server test data.
 """
 import pytest
 
+from app.extensions import db
+from app.models import Server
 from tests.factories import ServerFactory
 
 
@@ -12,25 +14,20 @@ from tests.factories import ServerFactory
 def test_server(app, admin_user):
     """Create a test server for testing."""
     with app.app_context():
-        from app.extensions import db
-
         server = ServerFactory.create(
             server_name="testserver",
             owner_id=admin_user.id,
         )
         db.session.add(server)
         db.session.commit()
-        # Refresh the server to ensure it's properly attached to the session
-        db.session.refresh(server)
-        return server
+        # Load the committed row before the app context ends
+        return db.session.get(Server, server.id)
 
 
 @pytest.fixture
 def running_server(app, admin_user):
     """Create a running server for testing."""
     with app.app_context():
-        from app.extensions import db
-
         server = ServerFactory.create_running(
             server_name="runningserver",
             owner_id=admin_user.id,
@@ -45,8 +42,6 @@ def running_server(app, admin_user):
 def stopped_server(app, admin_user):
     """Create a stopped server for testing."""
     with app.app_context():
-        from app.extensions import db
-
         server = ServerFactory.create_stopped(
             server_name="stoppedserver",
             owner_id=admin_user.id,
@@ -61,8 +56,6 @@ def stopped_server(app, admin_user):
 def multiple_servers(app, admin_user):
     """Create multiple servers for testing."""
     with app.app_context():
-        from app.extensions import db
-
         servers = []
         # Create 3 servers with different configurations
         for i in range(3):
@@ -88,8 +81,6 @@ def multiple_servers(app, admin_user):
 def server_with_custom_settings(app, admin_user):
     """Create a server with custom game settings for testing."""
     with app.app_context():
-        from app.extensions import db
-
         server = ServerFactory.create_with_custom_settings(
             server_name="customserver",
             owner_id=admin_user.id,
@@ -104,8 +95,6 @@ def server_with_custom_settings(app, admin_user):
 def servers_with_different_owners(app, multiple_users):
     """Create servers owned by different users."""
     with app.app_context():
-        from app.extensions import db
-
         servers = []
         # Create one server for each user
         for i, user in enumerate(multiple_users):
@@ -130,8 +119,6 @@ def servers_with_different_owners(app, multiple_users):
 def memory_test_servers(app, admin_user):
     """Create servers for memory management testing."""
     with app.app_context():
-        from app.extensions import db
-
         servers = []
         memory_allocations = [512, 1024, 2048, 4096]
 
@@ -5,6 +5,7 @@ This module provides fixtures for creating and managing user test data.
 """
 import pytest
 
+from app.extensions import db
 from app.models import User
 from tests.factories import UserFactory
 
@@ -13,8 +14,6 @@ from tests.factories import UserFactory
 def admin_user(app):
     """Get or create an admin user for testing."""
     with app.app_context():
-        from app.extensions import db
-
         # Check if admin user already exists (created by app fixture)
         user = User.query.filter_by(username="admin").first()
         if not user:
@@ -24,8 +23,8 @@ def admin_user(app):
             )
             db.session.add(user)
             db.session.commit()
-            # Refresh the user to ensure it's properly attached to the session
-            db.session.refresh(user)
+            # Load the committed row before the app context ends
+            user = db.session.get(User, user.id)
         return user
 
 
@@ -33,23 +32,18 @@ def admin_user(app):
 def regular_user(app):
     """Create a regular user for testing."""
     with app.app_context():
-        from app.extensions import db
-
         # Always create a fresh regular user for each test
         user = UserFactory.create_regular(username="testuser")
         db.session.add(user)
         db.session.commit()
-        # Refresh the user to ensure it's properly attached to the session
-        db.session.refresh(user)
-        return user
+        # Load the committed row before the app context ends
+        return db.session.get(User, user.id)
 
 
 @pytest.fixture
 def inactive_user(app):
     """Create an inactive user for testing."""
     with app.app_context():
-        from app.extensions import db
-
         user = UserFactory.create_inactive(username="inactiveuser")
         db.session.add(user)
         db.session.commit()
@@ -61,8 +55,6 @@ def inactive_user(app):
 def multiple_users(app):
     """Create multiple users for testing."""
     with app.app_context():
-        from app.extensions import db
-
         users = []
         # Create 3 regular users
         for i in range(3):
@@ -88,8 +80,6 @@ def multiple_users(app):
 def user_with_custom_attributes(app):
     """Create a user with custom attributes for testing."""
     with app.app_context():
-        from app.extensions import db
-
         user = UserFactory.create(
             username="customuser",
             password="custompass",  # pragma: allowlist secret
@@ -11,6 +11,9 @@ from typing import Generator
 
 import pytest
 
+from app.extensions import db
+from app.models import ExperimentalFeature
+
 
 @contextmanager
 def managed_temp_directory(
@@ -134,9 +137,6 @@ def mock_subprocess():
 @pytest.fixture
 def feature_flags_fixture(app):
     """Create default experimental feature flags for testing."""
-    from app.extensions import db
-    from app.models import ExperimentalFeature
-
     with app.app_context():
         # Create the server_management_page feature flag if it doesn't exist
         feature = ExperimentalFeature.query.filter_by(feature_key="server_management_page").first()
@@ -117,6 +117,18 @@ class TestMemoryCalculation:
             expected = 8192 - 1024  # Default max - allocated
             assert available == expected
 
+    def test_get_available_memory_with_precomputed_values(self, app):
+        """Test available memory uses caller-supplied config and allocation."""
+        with app.app_context():
+            with patch("app.utils.get_memory_config") as mock_config, patch(
+                "app.utils.get_total_allocated_memory"
+            ) as mock_allocated:
+                available = get_available_memory(config={"max_total_mb": 4096}, allocated=1024)
+
+            assert available == 3072
+            mock_config.assert_not_called()
+            mock_allocated.assert_not_called()
+
 
 class TestMemoryValidation:
     """Test memory allocation validation."""
@@ -194,12 +206,16 @@ class TestMemoryDisplay:
         """Test formatting memory in MB."""
         assert format_memory_display(512) == "512MB"
         assert format_memory_display(1023) == "1023MB"
+        # Float input keeps its type in the output
+        assert format_memory_display(512.0) == "512.0MB"
 
     def test_format_memory_display_gb(self):
         """Test formatting memory in GB."""
         assert format_memory_display(1024) == "1.0GB"
         assert format_memory_display(2048) == "2.0GB"
         assert format_memory_display(1536) == "1.5GB"
+        assert format_memory_display(8192) == "8.0GB"
+        assert format_memory_display(2007) == "2.0GB"
 
     def test_get_memory_usage_summary(self, app, admin_user):
         """Test memory usage summary."""
@@ -226,6 +242,27 @@ class TestMemoryDisplay:
             assert summary["available_memory_display"] == "7.0GB"
             assert summary["usage_percentage"] == 12.5  # 1024/8192 * 100
 
+    def test_get_memory_usage_summary_without_servers(self, app):
+        """Test memory usage summary when no servers exist."""
+        with app.app_context():
+            summary = get_memory_usage_summary()
+
+            assert summary["allocated_memory_mb"] == 0
+            assert summary["available_memory_mb"] == summary["total_memory_mb"]
+            assert summary["usage_percentage"] == 0.0
+
+    def test_get_memory_usage_summary_passes_precomputed_values(self, app):
+        """Test the summary hands its config and allocation to get_available_memory."""
+        with app.app_context():
+            with patch("app.utils.get_memory_config") as mock_config, patch(
+                "app.utils.get_total_allocated_memory"
+            ) as mock_allocated:
+                summary = get_memory_usage_summary()
+
+            assert summary["available_memory_mb"] == summary["total_memory_mb"]
+            mock_config.assert_not_called()
+            mock_allocated.assert_not_called()
+
 
 class TestMemoryInServerCreation:
     """Test memory validation in server creation."""
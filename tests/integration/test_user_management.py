@@ -599,6 +599,16 @@ class TestFirstTimeSetup:
             assert response.status_code == 302
             assert "set_admin_password" in response.location
 
+    def test_index_redirect_admin_with_empty_password_hash(self, client_no_admin, app_no_admin):
+        """Test that an admin with an empty password hash still gets the setup redirect."""
+        with app_no_admin.app_context():
+            db.session.add(User(username="admin", password_hash="", is_admin=True))
+            db.session.commit()
+
+            response = client_no_admin.get("/")
+            assert response.status_code == 302
+            assert "set_admin_password" in response.location
+
     def test_index_redirect_with_admin(self, client, app):
         """Test that index redirects to login when admin exists."""
         with app.app_context():
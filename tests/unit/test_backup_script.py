@@ -0,0 +1,219 @@
+"""
+Unit tests for the database backup script.
+
+This module runs scripts/backup.py against a temporary SQLite database,
+covering backup creation, listing, validation, restore, cleanup and the
+batch subcommand.
+"""
+
+import io
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from scripts.backup import DatabaseBackup, main
+
+
+def _journal_mode(db_path):
+    """Read a database's persistent journal mode."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _usernames(db_path):
+    """Read the usernames stored in a database."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT username FROM user ORDER BY id")]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def live_db(tmp_path, monkeypatch):
+    """Create a small app database and run the script from its directory."""
+    monkeypatch.chdir(tmp_path)
+    db_path = tmp_path / "live.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE user (id INTEGER PRIMARY KEY, username TEXT);
+        CREATE TABLE server (id INTEGER PRIMARY KEY, server_name TEXT);
+        CREATE TABLE configuration (id INTEGER PRIMARY KEY, key TEXT);
+        INSERT INTO user (username) VALUES ('admin');
+        """
+    )
+    conn.close()
+    return db_path
+
+
+@pytest.fixture
+def backup_app(live_db):
+    """Create a minimal app pointing at the temporary database."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{live_db}"
+    return app
+
+
+@pytest.fixture
+def backup_manager(backup_app):
+    """Create a backup manager for the temporary database."""
+    return DatabaseBackup(app=backup_app)
+
+
+@pytest.mark.unit
+class TestDatabaseBackupScript:
+    """Test the DatabaseBackup manager against a real SQLite file."""
+
+    def test_create_backup_copies_database_and_metadata(self, backup_manager, live_db):
+        """Test a backup holds the data and metadata describes its tables."""
+        backup_path = backup_manager.create_backup("backup_first")
+
+        assert _usernames(backup_path) == ["admin"]
+        metadata = backup_manager._load_metadata("backups/backup_first_metadata.json")
+        assert metadata["backup_name"] == "backup_first"
+        assert metadata["tables"]["user"] == {"columns": 2, "rows": 1}
+        assert metadata["file_size"] == metadata["page_size"] * metadata["page_count"]
+
+    def test_create_backup_leaves_source_journal_mode_unchanged(self, backup_manager, live_db):
+        """Test backing up does not switch the live database to WAL or leave sidecars."""
+        assert _journal_mode(live_db) == "delete"
+
+        backup_manager.create_backup("backup_first")
+
+        assert _journal_mode(live_db) == "delete"
+        assert not os.path.exists(f"{live_db}-wal")
+        assert not os.path.exists(f"{live_db}-shm")
+
+    def test_list_backups_newest_first(self, backup_manager):
+        """Test backups are listed newest first, using mtime without metadata."""
+        backup_manager.create_backup("backup_old")
+        os.unlink("backups/backup_old_metadata.json")
+        os.utime("backups/backup_old.db", (1_000_000_000, 1_000_000_000))
+        backup_manager.create_backup("backup_new")
+
+        backups = backup_manager.list_backups()
+
+        assert [backup["name"] for backup in backups] == ["backup_new", "backup_old"]
+        assert backups[0]["tables"]["user"]["rows"] == 1
+        assert backups[1]["tables"] == {}
+        assert backups[1]["created"].startswith("2001-09-")
+
+    def test_list_backups_with_dotted_name(self, backup_manager):
+        """Test metadata is found for backup names containing dots."""
+        backup_manager.create_backup("backup_v1.2.3")
+
+        backups = backup_manager.list_backups()
+
+        assert [backup["name"] for backup in backups] == ["backup_v1.2.3"]
+        assert backups[0]["tables"]["user"]["rows"] == 1
+        assert os.path.exists("backups/backup_v1.2.3_metadata.json")
+
+    def test_validate_database(self, backup_manager, live_db, tmp_path):
+        """Test validation accepts the app schema and rejects broken databases."""
+        assert backup_manager._validate_database(live_db) is True
+        assert backup_manager._validate_database(live_db, deep=True) is True
+
+        partial = tmp_path / "partial.db"
+        conn = sqlite3.connect(partial)
+        conn.execute("CREATE TABLE user (id INTEGER PRIMARY KEY)")
+        conn.close()
+        assert backup_manager._validate_database(partial) is False
+
+        missing = tmp_path / "missing.db"
+        assert backup_manager._validate_database(missing) is False
+        assert not missing.exists()
+
+    def test_restore_backup_keeps_safety_copy(self, backup_manager, live_db, tmp_path):
+        """Test a restore brings back the backup and saves the replaced database."""
+        backup_manager.create_backup("backup_first")
+        conn = sqlite3.connect(live_db)
+        conn.execute("INSERT INTO user (username) VALUES ('later')")
+        conn.commit()
+        conn.close()
+
+        backup_manager.restore_backup("backup_first", deep=True)
+
+        assert _usernames(live_db) == ["admin"]
+        assert _journal_mode(live_db) == "delete"
+        safety_copies = list(tmp_path.glob("live.db.pre_restore_*"))
+        assert len(safety_copies) == 1
+        assert _usernames(safety_copies[0]) == ["admin", "later"]
+
+    def test_restore_backup_includes_uncheckpointed_wal_changes(self, backup_manager, live_db):
+        """Test the safety copy includes changes still in the live database's WAL."""
+        backup_manager.create_backup("backup_first")
+        writer = sqlite3.connect(live_db)
+        try:
+            writer.execute("PRAGMA journal_mode=WAL")
+            writer.execute("PRAGMA wal_autocheckpoint=0")
+            writer.execute("INSERT INTO user (username) VALUES ('pending')")
+            writer.commit()
+
+            backup_manager.restore_backup("backup_first")
+        finally:
+            writer.close()
+
+        safety_copy = next(live_db.parent.glob("live.db.pre_restore_*"))
+        assert _usernames(safety_copy) == ["admin", "pending"]
+
+    def test_restore_missing_backup(self, backup_manager):
+        """Test restoring an unknown backup raises without touching the database."""
+        with pytest.raises(FileNotFoundError):
+            backup_manager.restore_backup("backup_missing")
+
+    def test_cleanup_old_backups(self, backup_manager):
+        """Test cleanup keeps the newest backups and removes old metadata too."""
+        for index, name in enumerate(["backup_a", "backup_b", "backup_c"]):
+            backup_manager.create_backup(name)
+            os.utime(f"backups/{name}.db", (1_000_000 + index, 1_000_000 + index))
+
+        backup_manager.cleanup_old_backups(keep_count=1)
+
+        assert sorted(os.listdir("backups")) == ["backup_c.db", "backup_c_metadata.json"]
+
+
+@pytest.mark.unit
+class TestBackupScriptCli:
+    """Test the backup script's command line entry point."""
+
+    def test_batch_runs_commands_with_one_app(self, backup_app, capsys):
+        """Test batch runs each stdin command, skipping blanks and comments."""
+        commands = io.StringIO(
+            "create --name backup_a\n"
+            "# nightly job\n"
+            "\n"
+            "create --name backup_b\n"
+            "list\n"
+            "cleanup --keep 1\n"
+        )
+
+        with patch("scripts.backup.create_app", return_value=backup_app) as mock_create, patch(
+            "sys.argv", ["backup.py", "batch"]
+        ), patch("sys.stdin", commands):
+            main()
+
+        mock_create.assert_called_once()
+        output = capsys.readouterr().out
+        assert "Backup created: backups/backup_a.db" in output
+        assert "backup_b" in output
+        assert "Cleanup complete. Kept 1 most recent backups." in output
+        assert len([name for name in os.listdir("backups") if name.endswith(".db")]) == 1
+
+    def test_batch_rejects_nested_batch(self, backup_app, capsys):
+        """Test a batch stops with an error on an invalid command."""
+        with patch("scripts.backup.create_app", return_value=backup_app), patch(
+            "sys.argv", ["backup.py", "batch"]
+        ), patch("sys.stdin", io.StringIO("batch\ncreate --name backup_a\n")):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        assert "Invalid batch command: batch" in capsys.readouterr().out
+        assert not os.listdir("backups")
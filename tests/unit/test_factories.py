@@ -0,0 +1,82 @@
+"""
+Tests for the test data factories.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.extensions import db
+from app.models import Server, User
+from tests.factories import ServerFactory, TestDataFactory, UserFactory
+from tests.utils.database_seeder import seed_memory_test_data, seed_multi_user_data
+
+
+@pytest.mark.unit
+class TestFactoryDefaults:
+    """Test how the factories generate default values."""
+
+    def test_user_factory_usernames_are_unique(self):
+        """Test generated usernames come from a sequence and never repeat."""
+        usernames = [UserFactory.create().username for _ in range(50)]
+
+        assert len(set(usernames)) == len(usernames)
+
+    def test_server_factory_names_and_ports_are_unique(self):
+        """Test generated server names, ports and seeds never repeat."""
+        servers = [ServerFactory.create() for _ in range(50)]
+
+        assert len({server.server_name for server in servers}) == len(servers)
+        assert len({server.port for server in servers}) == len(servers)
+        assert len({server.level_seed for server in servers}) == len(servers)
+        assert all(25565 <= server.port <= 26565 for server in servers)
+
+    def test_randomize_uses_random_values(self):
+        """Test randomize=True draws names, ports and seeds at random."""
+        with patch("tests.factories.random.randint", side_effect=[1234, 4321, 25999]):
+            user = UserFactory.create(randomize=True)
+            server = ServerFactory.create(randomize=True)
+
+        assert user.username == "testuser_1234"
+        assert server.server_name == "testserver_4321"
+        assert server.level_seed == "seed_4321"
+        assert server.port == 25999
+
+
+@pytest.mark.unit
+class TestBulkSeeding:
+    """Test scenarios bulk-inserted through a session."""
+
+    def test_create_user_with_servers_persists_owners(self, app):
+        """Test each bulk-inserted server is owned by the user it was built for."""
+        with app.app_context():
+            data = TestDataFactory.create_user_with_servers(
+                user_count=2, servers_per_user=2, admin_users=1, session=db.session
+            )
+
+            # The app fixture already seeds the default admin user
+            assert User.query.count() == 4
+            assert Server.query.count() == 6
+            for index, server in enumerate(data["servers"]):
+                owner = data["users"][index // 2]
+                assert server.id is not None
+                assert server.owner_id == owner.id
+                assert db.session.get(Server, server.id).owner.username == owner.username
+            for user in data["users"]:
+                assert len(db.session.get(User, user.id).servers) == 2
+
+    def test_seeders_commit_through_db_session(self, app):
+        """Test the bulk seeders commit their rows with working relationships."""
+        with app.app_context():
+            memory = seed_memory_test_data()
+            multi = seed_multi_user_data(user_count=3, servers_per_user=1, admin_count=1)
+            # Anything left uncommitted by the seeders would be lost here
+            db.session.rollback()
+
+            assert User.query.count() == 1 + len(memory["users"]) + len(multi["users"])
+            assert Server.query.count() == len(memory["servers"]) + len(multi["servers"])
+            memory_admin = db.session.get(User, memory["users"][0].id)
+            assert memory_admin.is_admin is True
+            memory_sizes = sorted(server.memory_mb for server in memory_admin.servers)
+            assert memory_sizes == [1638, 1738, 1838, 1938, 2038]
+            owner_names = {server.owner.username for server in Server.query.all()}
+            assert {"admin_0", "user_0", "user_1", "user_2"} <= owner_names
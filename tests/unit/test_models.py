@@ -5,7 +5,7 @@ import pytest
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.extensions import db
-from app.models import Server, User
+from app.models import Configuration, Server, User
 
 
 @pytest.mark.unit
@@ -367,3 +367,29 @@ class TestServerModel:
                 server = Server.query.filter_by(server_name=name).first()
                 assert server is not None
                 assert server.port == port
+
+
+@pytest.mark.unit
+class TestConfigurationModel:
+    """Test Configuration model functionality."""
+
+    def test_configuration_unique_key(self, app):
+        """Test that configuration keys must be unique."""
+        with app.app_context():
+            db.session.add(Configuration(key="app_title", value="First"))
+            db.session.commit()
+
+            db.session.add(Configuration(key="app_title", value="Second"))
+            with pytest.raises(Exception):
+                db.session.commit()
+            db.session.rollback()
+
+    def test_configuration_key_lookup_uses_index(self, app):
+        """Test that lookups by key are served by the unique index, not a table scan."""
+        with app.app_context():
+            plan = db.session.execute(
+                db.text("EXPLAIN QUERY PLAN SELECT * FROM configuration WHERE key = :key"),
+                {"key": "app_title"},
+            ).fetchall()
+
+            assert any("USING INDEX" in row[-1] for row in plan)
@@ -5,6 +5,7 @@ import re
 from unittest.mock import patch
 
 import pytest
+from werkzeug.security import check_password_hash
 
 from app.security import (
     PasswordPolicyError,
@@ -12,6 +13,7 @@ from app.security import (
     SecurityError,
     SecurityUtils,
     audit_log,
+    hash_password,
     secure_filename,
     validate_file_upload,
 )
@@ -79,6 +81,22 @@ class TestPasswordPolicy:
                 with pytest.raises(PasswordPolicyError, match="too common"):
                     SecurityUtils.validate_password(weak_pass)
 
+    def test_hash_password_uses_configured_method(self, app):
+        """Test new password hashes use PASSWORD_HASH_METHOD and still verify."""
+        with app.app_context():
+            password_hash = hash_password("ValidPass123")  # pragma: allowlist secret
+
+            assert password_hash.startswith(app.config["PASSWORD_HASH_METHOD"] + "$")
+            assert check_password_hash(password_hash, "ValidPass123")
+
+    def test_password_hash_method_defaults_to_scrypt(self):
+        """Test only the testing config lowers the password hash cost."""
+        from config.base import BaseConfig
+        from config.testing import TestingConfig
+
+        assert BaseConfig.PASSWORD_HASH_METHOD == "scrypt"
+        assert TestingConfig.PASSWORD_HASH_METHOD == "pbkdf2:sha256:1"
+
 
 class TestInputSanitization:
     """Test input sanitization functions."""
@@ -359,6 +377,24 @@ class TestConfigurationSecurity:
         # Should be a secure random key
         assert len(app.config["SECRET_KEY"]) >= 32
 
+    def test_generated_secret_key_is_stable(self):
+        """Test a missing SECRET_KEY yields one generated key per process."""
+        from config.base import BaseConfig
+
+        with patch.object(BaseConfig, "SECRET_KEY", None):
+            first = BaseConfig.get_secret_key()
+
+            assert len(first) == 64
+            assert BaseConfig.get_secret_key() == first
+
+    def test_production_requires_secret_key(self):
+        """Test production refuses to run with a generated SECRET_KEY."""
+        from config.production import ProductionConfig
+
+        with patch.object(ProductionConfig, "SECRET_KEY", None):
+            with pytest.raises(ValueError):
+                ProductionConfig.get_secret_key()
+
     def test_security_headers_configuration(self, app):
         """Test security headers configuration."""
         headers = app.config.get("SECURITY_HEADERS", {})
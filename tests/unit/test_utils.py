@@ -1,26 +1,49 @@
 """
 Tests for utility functions.
 """
+import errno
 import json
 import os
+import socket
 import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+import app.utils as app_utils
 from app.error_handlers import FileOperationError, NetworkError, ServerError, ValidationError
 from app.extensions import db
-from app.models import Server
+from app.models import Configuration, Server, User
 from app.utils import (
+    clear_version_manifest_cache,
+    describe_process,
     fetch_version_manifest,
     find_next_available_port,
+    find_orphaned_minecraft_processes,
+    get_app_config,
+    get_server_process_info,
     get_version_info,
+    initialize_default_config,
+    is_admin_password_set,
     is_port_available,
     is_valid_server_name,
     load_exclusion_list,
+    periodic_status_check,
+    reconcile_server_statuses,
+    reset_admin_password_cache,
+    update_app_config,
+    verify_process_status,
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_version_manifest_cache():
+    """Ensure each test starts without a cached version manifest."""
+    clear_version_manifest_cache()
+    yield
+    clear_version_manifest_cache()
+
+
 @pytest.mark.unit
 @pytest.mark.utils
 class TestUtilityFunctions:
@@ -79,25 +102,87 @@ class TestUtilityFunctions:
         for name in invalid_names:
             assert not is_valid_server_name(name), f"'{name}' should be invalid"
 
+    def test_is_valid_server_name_traversal_patterns(self):
+        """Test traversal and shell patterns are rejected by the charset alone."""
+        for name in ["..", "../etc", "./server", "~root", "server`id`", "$HOME", "a\\b"]:
+            assert not is_valid_server_name(name), f"'{name}' should be invalid"
+
+    def test_is_valid_server_name_reserved(self):
+        """Test reserved device names are rejected regardless of case."""
+        for name in ["con", "PRN", "Aux", "nul", "com1", "COM9", "lpt1", "LPT9"]:
+            assert not is_valid_server_name(name), f"'{name}' should be invalid"
+
+        assert is_valid_server_name("com10")
+        assert is_valid_server_name("console")
+
+    def test_is_valid_server_name_length_limits(self):
+        """Test the 150 character limit and non-string input."""
+        assert is_valid_server_name("a" * 150)
+        assert not is_valid_server_name("a" * 151)
+        assert not is_valid_server_name("server\n")
+        assert not is_valid_server_name(None)
+        assert not is_valid_server_name(12345)
+
     @patch("socket.socket")
     def test_is_port_available_true(self, mock_socket):
         """Test port availability when port is available."""
         mock_sock = MagicMock()
-        mock_sock.connect_ex.return_value = 1  # Connection failed (port available)
         mock_socket.return_value.__enter__.return_value = mock_sock
 
         assert is_port_available(25565) is True
-        mock_sock.connect_ex.assert_called_once_with(("localhost", 25565))
+        mock_sock.bind.assert_called_once_with(("", 25565))
+        mock_sock.listen.assert_called_once_with(1)
 
     @patch("socket.socket")
     def test_is_port_available_false(self, mock_socket):
         """Test port availability when port is in use."""
         mock_sock = MagicMock()
-        mock_sock.connect_ex.return_value = 0  # Connection succeeded (port in use)
+        mock_sock.bind.side_effect = OSError(errno.EADDRINUSE, "Address already in use")
+        mock_socket.return_value.__enter__.return_value = mock_sock
+
+        assert is_port_available(25565) is False
+        mock_sock.bind.assert_called_once_with(("", 25565))
+        mock_sock.listen.assert_not_called()
+
+    @patch("socket.create_connection")
+    @patch("socket.socket")
+    def test_is_port_available_permission_denied(self, mock_socket, mock_connect):
+        """Test a port the OS refuses to this process is unavailable without probing."""
+        mock_sock = MagicMock()
         mock_socket.return_value.__enter__.return_value = mock_sock
+        mock_connect.side_effect = ConnectionRefusedError()
+
+        for error in (errno.EACCES, errno.EPERM):
+            mock_sock.bind.side_effect = PermissionError(error, "Permission denied")
+            assert is_port_available(25565) is False
+
+        mock_connect.assert_not_called()
+
+    @patch("socket.create_connection")
+    @patch("socket.socket")
+    def test_is_port_available_inconclusive_bind_falls_back_to_connect(
+        self, mock_socket, mock_connect
+    ):
+        """Test an ambiguous bind failure defers to a connect probe."""
+        mock_sock = MagicMock()
+        mock_sock.bind.side_effect = OSError(errno.EADDRNOTAVAIL, "Address not available")
+        mock_socket.return_value.__enter__.return_value = mock_sock
+
+        mock_connect.side_effect = ConnectionRefusedError()
+        assert is_port_available(25565) is True
 
+        mock_connect.side_effect = None
         assert is_port_available(25565) is False
-        mock_sock.connect_ex.assert_called_once_with(("localhost", 25565))
+        mock_connect.assert_called_with(("localhost", 25565), timeout=0.2)
+
+    def test_is_port_available_detects_bound_socket(self):
+        """Test a port held by a local listener is reported as unavailable."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind(("", 0))
+            listener.listen(1)
+            port = listener.getsockname()[1]
+
+            assert is_port_available(port) is False
 
     def test_find_next_available_port_first_available(self, app):
         """Test finding next available port when first port is available."""
@@ -107,20 +192,18 @@ class TestUtilityFunctions:
 
                 port = find_next_available_port()
                 assert port == 25565
-                mock_available.assert_called_once_with(25565)
+                mock_available.assert_any_call(25565)
 
     def test_find_next_available_port_second_available(self, app):
         """Test finding next available port when second port is available."""
         with app.app_context():
             with patch("app.utils.is_port_available") as mock_available:
-                mock_available.side_effect = [
-                    False,
-                    True,
-                ]  # First unavailable, second available
+                # First unavailable, everything after it available
+                mock_available.side_effect = lambda port: port != 25565
 
                 port = find_next_available_port()
                 assert port == 25575
-                assert mock_available.call_count == 2
+                mock_available.assert_any_call(25565)
 
     def test_find_next_available_port_with_assigned_ports(self, app, admin_user):
         """Test finding port when some ports are assigned to servers."""
@@ -141,8 +224,10 @@ class TestUtilityFunctions:
 
                 port = find_next_available_port()
                 assert port == 25575  # Should skip 25565 and return 25575
-                # Should check 25575 since 25565 is assigned
-                mock_available.assert_called_once_with(25575)
+                # Should never probe 25565 since it is assigned
+                probed = [call.args[0] for call in mock_available.call_args_list]
+                assert 25565 not in probed
+                assert 25575 in probed
 
     def test_find_next_available_port_all_unavailable(self, app):
         """Test when no ports are available."""
@@ -153,14 +238,39 @@ class TestUtilityFunctions:
                 with pytest.raises(ServerError, match="No available ports found"):
                     find_next_available_port()
 
-    @patch("requests.get")
+    def test_find_next_available_port_returns_lowest_free_port(self, app):
+        """Test the lowest free candidate wins even when probes run concurrently."""
+        with app.app_context():
+            with patch("app.utils.is_port_available") as mock_available:
+                mock_available.side_effect = lambda port: port in (25595, 25625)
+
+                assert find_next_available_port() == 25595
+                assert mock_available.call_count == 20
+
+    def test_find_next_available_port_skips_probe_errors(self, app):
+        """Test a port whose probe fails is skipped rather than aborting the scan."""
+        with app.app_context():
+            with patch("app.utils.is_port_available") as mock_available:
+
+                def probe(port):
+                    if port == 25565:
+                        raise ServerError("Unable to check port availability")
+                    return True
+
+                mock_available.side_effect = probe
+
+                assert find_next_available_port() == 25575
+
+    @patch("app.utils._HTTP.get")
     def test_fetch_version_manifest_success(self, mock_get):
         """Test successful version manifest fetch."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "latest": {"release": "1.20.1"},
-            "versions": [{"id": "1.20.1", "type": "release"}],
-        }
+        mock_response.content = json.dumps(
+            {
+                "latest": {"release": "1.20.1"},
+                "versions": [{"id": "1.20.1", "type": "release"}],
+            }
+        ).encode()
         mock_get.return_value = mock_response
 
         manifest = fetch_version_manifest()
@@ -168,7 +278,74 @@ class TestUtilityFunctions:
         mock_get.assert_called_once()
         mock_response.raise_for_status.assert_called_once()
 
-    @patch("requests.get")
+    @patch("app.utils._HTTP.get")
+    def test_fetch_version_manifest_cached_within_ttl(self, mock_get):
+        """Test repeated manifest fetches within the TTL reuse the parsed copy."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"versions": [{"id": "1.20.1"}]}'
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        first = fetch_version_manifest()
+        second = fetch_version_manifest()
+
+        assert first is second
+        mock_get.assert_called_once()
+
+    @patch("app.utils._HTTP.get")
+    def test_fetch_version_manifest_revalidates_with_etag(self, mock_get):
+        """Test an expired manifest is revalidated and a 304 keeps the cached copy."""
+        fresh = MagicMock()
+        fresh.status_code = 200
+        fresh.content = b'{"versions": [{"id": "1.20.1"}]}'
+        fresh.headers = {"ETag": '"abc"'}
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [fresh, not_modified]
+
+        first = fetch_version_manifest()
+        app_utils._MANIFEST_CACHE["expires_at"] = 0.0  # Force the TTL to lapse
+        second = fetch_version_manifest()
+
+        assert second == first
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        not_modified.raise_for_status.assert_not_called()
+
+    @patch("app.utils._HTTP.get")
+    def test_fetch_version_manifest_survives_restart_via_disk_cache(self, mock_get, app, tmp_path):
+        """Test a manifest saved on disk is revalidated instead of re-downloaded."""
+        cache_file = tmp_path / "version_manifest_cache.json"
+        app.config["VERSION_MANIFEST_CACHE_FILE"] = str(cache_file)
+
+        fresh = MagicMock()
+        fresh.status_code = 200
+        fresh.content = b'{"versions": [{"id": "1.20.1"}]}'
+        fresh.headers = {"ETag": '"abc"'}
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [fresh, not_modified]
+
+        with app.app_context():
+            first = fetch_version_manifest()
+            assert json.loads(cache_file.read_text())["etag"] == '"abc"'
+
+            clear_version_manifest_cache()  # Simulate a process restart
+            second = fetch_version_manifest()
+
+        assert second == first
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+    @patch("app.utils._HTTP.get")
+    def test_fetch_version_manifest_invalid_json(self, mock_get):
+        """Test version manifest fetch with a malformed JSON body."""
+        mock_response = MagicMock()
+        mock_response.content = b"not json"
+        mock_get.return_value = mock_response
+
+        with pytest.raises(NetworkError, match="Invalid JSON response"):
+            fetch_version_manifest()
+
+    @patch("app.utils._HTTP.get")
     def test_fetch_version_manifest_network_error(self, mock_get):
         """Test version manifest fetch with network error."""
         import requests
@@ -179,7 +356,7 @@ class TestUtilityFunctions:
             fetch_version_manifest()
 
     @patch("app.utils.fetch_version_manifest")
-    @patch("requests.get")
+    @patch("app.utils._HTTP.get")
     def test_get_version_info_success(self, mock_get, mock_fetch):
         """Test successful version info retrieval."""
         # Mock manifest
@@ -189,9 +366,9 @@ class TestUtilityFunctions:
 
         # Mock version metadata
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "downloads": {"server": {"url": "http://example.com/server.jar"}}
-        }
+        mock_response.content = json.dumps(
+            {"downloads": {"server": {"url": "http://example.com/server.jar"}}}
+        ).encode()
         mock_get.return_value = mock_response
 
         version_info = get_version_info("1.20.1")
@@ -208,6 +385,29 @@ class TestUtilityFunctions:
         with pytest.raises(ValidationError, match="Version 'nonexistent' not found"):
             get_version_info("nonexistent")
 
+    @patch("app.utils._HTTP.get")
+    def test_version_index_built_once_for_cached_manifest(self, mock_get):
+        """Test version lookups on the cached manifest reuse one id index."""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(
+            {
+                "versions": [
+                    {"id": "1.20.1", "url": "http://example.com/1.20.1.json"},
+                    {"id": "1.20", "url": "http://example.com/1.20.json"},
+                ]
+            }
+        ).encode()
+        mock_get.return_value = mock_response
+
+        manifest = fetch_version_manifest()
+        index = app_utils._get_version_index(manifest)
+
+        assert index["1.20"]["url"] == "http://example.com/1.20.json"
+        assert app_utils._get_version_index(fetch_version_manifest()) is index
+
+        clear_version_manifest_cache()
+        assert app_utils._MANIFEST_CACHE["version_index"] is None
+
     def test_load_exclusion_list_success(self):
         """Test loading exclusion list successfully."""
         # Create temporary exclusion file
@@ -222,10 +422,61 @@ class TestUtilityFunctions:
         finally:
             os.unlink(temp_file)
 
+    def test_load_exclusion_list_skips_invalid_entries(self):
+        """Test non-string and blank entries are dropped and values are stripped."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump([" 1.0 ", "", "   ", 42, None, "beta"], f)
+            temp_file = f.name
+
+        try:
+            assert load_exclusion_list(temp_file) == ["1.0", "beta"]
+        finally:
+            os.unlink(temp_file)
+
+    def test_load_exclusion_list_cached_until_modified(self):
+        """Test exclusion list is reparsed only when the file changes."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(["1.0"], f)
+            temp_file = f.name
+
+        try:
+            assert load_exclusion_list(temp_file) == ["1.0"]
+
+            with patch("app.utils.SafeFileOperation") as mock_open:
+                assert load_exclusion_list(temp_file) == ["1.0"]
+                mock_open.assert_not_called()
+
+            with open(temp_file, "w") as f:
+                json.dump(["1.0", "1.1"], f)
+            stat = os.stat(temp_file)
+            os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert load_exclusion_list(temp_file) == ["1.0", "1.1"]
+        finally:
+            os.unlink(temp_file)
+
     def test_load_exclusion_list_file_not_found(self):
         """Test loading exclusion list when file doesn't exist."""
-        with pytest.raises(FileOperationError, match="Failed to open file"):
-            load_exclusion_list("nonexistent_file.json")
+        with patch("app.utils.SafeFileOperation") as mock_open:
+            assert load_exclusion_list("nonexistent_file.json") == []
+            mock_open.assert_not_called()
+
+    def test_load_exclusion_list_rejects_traversal(self, tmp_path, monkeypatch):
+        """Test relative paths may not climb or symlink out of the working directory."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "excluded.json").write_text('["1.0"]')
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        (workdir / "escape").symlink_to(outside)
+        (workdir / "my..versions.json").write_text('["1.1"]')
+        monkeypatch.chdir(workdir)
+
+        with pytest.raises(ValidationError):
+            load_exclusion_list("../outside/excluded.json")
+        with pytest.raises(ValidationError):
+            load_exclusion_list("escape/excluded.json")
+        assert load_exclusion_list("my..versions.json") == ["1.1"]
 
     def test_load_exclusion_list_invalid_json(self):
         """Test loading exclusion list with invalid JSON."""
@@ -240,6 +491,66 @@ class TestUtilityFunctions:
         finally:
             os.unlink(temp_file)
 
+    def test_initialize_default_config_adds_only_missing_keys(self, app):
+        """Test default configuration only inserts keys that are absent."""
+        with app.app_context():
+            assert initialize_default_config() is True
+            assert Configuration.query.count() == 6
+
+            Configuration.query.filter_by(key="max_total_mb").delete()
+            Configuration.query.filter_by(key="app_title").first().value = "Custom Title"
+            db.session.commit()
+
+            assert initialize_default_config() is True
+
+            assert Configuration.query.filter_by(key="max_total_mb").first().value == "8192"
+            assert Configuration.query.filter_by(key="app_title").first().value == "Custom Title"
+            assert Configuration.query.count() == 6
+
+    def test_get_app_config_memoized_per_app_context(self, app):
+        """Test app config is read once per context and refreshed after updates."""
+        with app.app_context():
+            initialize_default_config()
+
+            with patch.object(Configuration, "query", wraps=Configuration.query) as mock_query:
+                first = get_app_config()
+                second = get_app_config()
+                assert first is second
+                assert mock_query.all.call_count == 1
+
+            assert update_app_config(app_title="Renamed") is True
+            assert get_app_config()["app_title"] == "Renamed"
+
+        with app.app_context():
+            assert get_app_config()["app_title"] == "Renamed"
+
+    def test_get_app_config_returns_typed_values(self, app):
+        """Test numeric settings come back as ints and missing keys use defaults."""
+        with app.app_context():
+            db.session.add(Configuration(key="max_total_mb", value="16384"))
+            db.session.add(Configuration(key="unrelated_key", value="ignored"))
+            db.session.commit()
+
+            config = get_app_config()
+            assert config["max_total_mb"] == 16384
+            assert config["max_server_mb"] == 4096
+            assert config["app_title"] == "Minecraft Server Manager"
+            assert "unrelated_key" not in config
+
+    def test_update_app_config_updates_and_inserts_in_one_pass(self, app):
+        """Test config updates touch existing rows and insert missing keys."""
+        with app.app_context():
+            initialize_default_config()
+            Configuration.query.filter_by(key="max_server_mb").delete()
+            db.session.commit()
+
+            assert update_app_config(app_title="Batched", max_per_server_mb=2048) is True
+
+            values = {entry.key: entry.value for entry in Configuration.query.all()}
+            assert values["app_title"] == "Batched"
+            assert values["max_server_mb"] == "2048"
+            assert Configuration.query.filter_by(key="app_title").count() == 1
+
 
 @pytest.mark.unit
 @pytest.mark.utils
@@ -312,3 +623,294 @@ class TestPortAllocation:
 
                 with pytest.raises(ServerError, match="No available ports found"):
                     find_next_available_port()
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+class TestOrphanedProcessDetection:
+    """Test detection of Minecraft processes not managed by the app."""
+
+    SERVER_CMDLINE = ["java", "-Xmx1024M", "-jar", "server.jar", "nogui"]
+
+    def test_find_orphaned_processes_reports_unmanaged_server(self, app):
+        """Test an unmanaged Minecraft server process is reported."""
+        with app.app_context():
+            with patch(
+                "app.utils._iter_java_processes",
+                return_value=[(4321, self.SERVER_CMDLINE), (4322, ["java", "-version"])],
+            ), patch("app.utils.psutil.Process") as mock_process_class:
+                mock_process = mock_process_class.return_value
+                mock_process.cwd.return_value = "/srv/orphan"
+                mock_process.create_time.return_value = 1640995200.0
+
+                orphaned = find_orphaned_minecraft_processes()
+
+            assert [orphan["pid"] for orphan in orphaned] == [4321]
+            assert orphaned[0]["cwd"] == "/srv/orphan"
+            mock_process_class.assert_called_once_with(4321)
+
+    def test_find_orphaned_processes_skips_managed_server(self, app, admin_user):
+        """Test a process whose PID belongs to a known server is not reported."""
+        with app.app_context():
+            server = Server(
+                server_name="managedserver",
+                version="1.20.1",
+                port=25565,
+                status="Running",
+                pid=4321,
+                owner_id=admin_user.id,
+            )
+            db.session.add(server)
+            db.session.commit()
+
+            with patch(
+                "app.utils._iter_java_processes", return_value=[(4321, self.SERVER_CMDLINE)]
+            ), patch("app.utils.psutil.Process") as mock_process_class:
+                assert find_orphaned_minecraft_processes() == []
+                mock_process_class.assert_not_called()
+
+    def test_find_orphaned_processes_matches_whole_arguments(self, app):
+        """Test server detection checks individual arguments, not substrings."""
+        with app.app_context():
+            candidates = [
+                (4321, ["java", "-jar", "/srv/mc/server.jar", "nogui"]),
+                (4322, ["java", "-jar", "server.jar.bak", "nogui"]),
+                (4323, ["java", "-jar", "server.jar", "--noguidance"]),
+            ]
+            with patch("app.utils._iter_java_processes", return_value=candidates), patch(
+                "app.utils.psutil.Process"
+            ):
+                orphaned = find_orphaned_minecraft_processes()
+
+            assert [orphan["pid"] for orphan in orphaned] == [4321]
+
+    def test_iter_java_processes_falls_back_to_psutil(self):
+        """Test non-Linux platforms filter psutil.process_iter results by name."""
+        java = MagicMock(info={"pid": 10, "name": "java", "cmdline": self.SERVER_CMDLINE})
+        other = MagicMock(info={"pid": 11, "name": "bash", "cmdline": ["bash"]})
+
+        with patch("app.utils.psutil.LINUX", False), patch(
+            "app.utils.psutil.process_iter", return_value=[java, other]
+        ):
+            assert list(app_utils._iter_java_processes()) == [(10, self.SERVER_CMDLINE)]
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+class TestServerStatusReconciliation:
+    """Test reconciliation of stored server statuses with live processes."""
+
+    def test_reconcile_marks_dead_servers_stopped(self, app, admin_user):
+        """Test servers whose processes are gone are stopped in one update."""
+        with app.app_context():
+            for i, pid in enumerate((1001, 1002, 1003)):
+                db.session.add(
+                    Server(
+                        server_name=f"reconcileserver{i}",
+                        version="1.20.1",
+                        port=25565 + (i * 10),
+                        status="Running",
+                        pid=pid,
+                        owner_id=admin_user.id,
+                    )
+                )
+            db.session.commit()
+
+            with patch("app.utils.verify_process_status") as mock_verify, patch(
+                "app.utils.find_orphaned_minecraft_processes", return_value=[]
+            ), patch.object(db.session, "commit", wraps=db.session.commit) as mock_commit:
+                mock_verify.side_effect = lambda pid: {"is_running": pid == 1002}
+
+                summary = reconcile_server_statuses()
+
+            assert summary["servers_checked"] == 3
+            assert summary["statuses_updated"] == 2
+            assert summary["errors"] == []
+            assert mock_commit.call_count == 1
+
+            statuses = {
+                server.server_name: (server.status, server.pid) for server in Server.query.all()
+            }
+            assert statuses == {
+                "reconcileserver0": ("Stopped", None),
+                "reconcileserver1": ("Running", 1002),
+                "reconcileserver2": ("Stopped", None),
+            }
+
+    def test_periodic_check_skips_probe_for_dead_pids(self, app, admin_user):
+        """Test dead PIDs are stopped without the full process probe."""
+        with app.app_context():
+            for i, pid in enumerate((1001, 1002)):
+                db.session.add(
+                    Server(
+                        server_name=f"periodicserver{i}",
+                        version="1.20.1",
+                        port=25565 + (i * 10),
+                        status="Running",
+                        pid=pid,
+                        owner_id=admin_user.id,
+                    )
+                )
+            db.session.commit()
+
+            with patch("app.utils._is_pid_alive", side_effect=lambda pid: pid == 1002), patch(
+                "app.utils.verify_process_status", return_value={"is_running": True}
+            ) as mock_verify:
+                summary = periodic_status_check()
+
+            assert summary["servers_checked"] == 2
+            assert summary["statuses_updated"] == 1
+            mock_verify.assert_called_once_with(1002)
+
+            stopped = Server.query.filter_by(server_name="periodicserver0").first()
+            assert stopped.status == "Stopped"
+            assert stopped.pid is None
+
+    def test_periodic_check_stops_servers_in_one_commit(self, app, admin_user):
+        """Test every dead server is stopped by a single commit."""
+        with app.app_context():
+            for i, pid in enumerate((2001, 2002, 2003)):
+                db.session.add(
+                    Server(
+                        server_name=f"bulkperiodicserver{i}",
+                        version="1.20.1",
+                        port=25565 + (i * 10),
+                        status="Running",
+                        pid=pid,
+                        owner_id=admin_user.id,
+                    )
+                )
+            db.session.commit()
+
+            with patch("app.utils._is_pid_alive", return_value=False), patch.object(
+                db.session, "commit", wraps=db.session.commit
+            ) as mock_commit:
+                summary = periodic_status_check()
+
+            assert summary["statuses_updated"] == 3
+            assert summary["errors"] == []
+            assert mock_commit.call_count == 1
+            assert Server.query.filter_by(status="Running").count() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+class TestProcessVerification:
+    """Test process liveness checks and process descriptions."""
+
+    def test_verify_process_status_reads_only_name_and_cmdline(self):
+        """Test verification skips the expensive per-process lookups."""
+        with patch("app.utils.psutil.Process") as mock_process_class:
+            mock_process = mock_process_class.return_value
+            mock_process.pid = 1234
+            mock_process.is_running.return_value = True
+            mock_process.name.return_value = "java"
+            mock_process.cmdline.return_value = ["java", "-jar", "server.jar", "nogui"]
+
+            status = verify_process_status(1234)
+
+        assert status["is_running"] is True
+        assert status["process_info"] == {
+            "pid": 1234,
+            "name": "java",
+            "cmdline": ["java", "-jar", "server.jar", "nogui"],
+        }
+        mock_process.memory_info.assert_not_called()
+        mock_process.cpu_percent.assert_not_called()
+        mock_process.cwd.assert_not_called()
+
+    def test_verify_process_status_rejects_non_java_process(self):
+        """Test a running process that is not Java is not treated as a server."""
+        with patch("app.utils.psutil.Process") as mock_process_class:
+            mock_process = mock_process_class.return_value
+            mock_process.is_running.return_value = True
+            mock_process.name.return_value = "bash"
+            mock_process.cmdline.return_value = ["bash"]
+
+            status = verify_process_status(1234)
+
+        assert status["is_running"] is False
+        assert status["error"] == "Process is not a Java application"
+
+    def test_is_pid_alive(self):
+        """Test the liveness probe for the current process and an unused PID."""
+        assert app_utils._is_pid_alive(os.getpid()) is True
+
+        with patch("os.pidfd_open", side_effect=ProcessLookupError, create=True):
+            assert app_utils._is_pid_alive(os.getpid()) is False
+
+    def test_is_pid_alive_falls_back_to_psutil(self):
+        """Test platforms without pidfd support use psutil.pid_exists."""
+        with patch("os.pidfd_open", side_effect=OSError(errno.ENOSYS, "nope"), create=True), patch(
+            "app.utils.psutil.pid_exists", return_value=True
+        ) as mock_exists:
+            assert app_utils._is_pid_alive(1234) is True
+            mock_exists.assert_called_once_with(1234)
+
+    def test_describe_process_returns_full_details(self):
+        """Test describe_process reports the current process in detail."""
+        info = describe_process(os.getpid())
+
+        assert info["pid"] == os.getpid()
+        assert info["cwd"] == os.getcwd()
+        assert info["memory_info"].rss > 0
+
+    def test_get_server_process_info_missing_pid(self):
+        """Test a vanished PID is reported as not running without an extra probe."""
+        server = Server(server_name="gone", pid=999999)
+
+        with patch("app.utils.psutil.Process", side_effect=app_utils.psutil.NoSuchProcess(999999)):
+            assert get_server_process_info(server) is None
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+class TestAdminPasswordCheck:
+    """Test the latched admin password setup check."""
+
+    def test_is_admin_password_set_false_without_admin(self, app_no_admin):
+        """Test the check stays false and unlatched while no admin has a password."""
+        with app_no_admin.app_context():
+            db.session.add(User(username="pendingadmin", password_hash=None, is_admin=True))
+            db.session.commit()
+
+            assert is_admin_password_set() is False
+            assert not app_no_admin.extensions.get("admin_password_set")
+
+    def test_is_admin_password_set_false_with_empty_hash(self, app_no_admin):
+        """Test an admin with an empty password hash still needs setup."""
+        with app_no_admin.app_context():
+            db.session.add(User(username="pendingadmin", password_hash="", is_admin=True))
+            db.session.commit()
+
+            assert is_admin_password_set() is False
+            assert not app_no_admin.extensions.get("admin_password_set")
+
+    def test_is_admin_password_set_latches_after_first_hit(self, app, admin_user):
+        """Test the database is not queried again once an admin password exists."""
+        with app.app_context():
+            assert is_admin_password_set() is True
+
+            with patch.object(db.session, "query") as mock_query:
+                assert is_admin_password_set() is True
+                mock_query.assert_not_called()
+
+    def test_is_admin_setup_exempt(self):
+        """Test only the setup page and static files bypass the admin check."""
+        assert app_utils.is_admin_setup_exempt("auth.set_admin_password")
+        assert app_utils.is_admin_setup_exempt("static")
+        assert app_utils.is_admin_setup_exempt("static_assets")
+        assert not app_utils.is_admin_setup_exempt("auth.login")
+        assert not app_utils.is_admin_setup_exempt(None)
+
+    def test_reset_admin_password_cache_forces_requery(self, app, admin_user):
+        """Test resetting the latch makes the next check hit the database again."""
+        with app.app_context():
+            assert is_admin_password_set() is True
+
+            User.query.filter_by(id=admin_user.id).update({"is_admin": False})
+            db.session.commit()
+            assert is_admin_password_set() is True  # Still latched
+
+            reset_admin_password_cache()
+            assert is_admin_password_set() is False
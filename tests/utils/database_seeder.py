@@ -56,6 +56,7 @@ def seed_memory_test_data() -> Dict[str, Any]:
     return TestDataFactory.create_memory_test_scenario(
         total_memory_mb=8192,
         server_count=5,
+        session=db.session,
     )
 
 
@@ -92,6 +93,7 @@ def seed_multi_user_data(
         user_count=user_count,
         servers_per_user=servers_per_user,
         admin_users=admin_count,
+        session=db.session,
     )
 
 